@@ -0,0 +1,246 @@
+"""
+RightWalk Foundation Economic Impact Model - Compiled Numeric Kernels
+=====================================================================
+
+Tight per-year loops used by economic_core_v4, JIT-compiled with Numba.
+
+Numba is OPTIONAL. When it is not installed NUMBA_AVAILABLE is False,
+`njit` becomes a no-op decorator, and economic_core_v4 keeps using its
+vectorized NumPy code paths instead of calling these kernels.
+
+Kernels only take floats, ints and contiguous float64 arrays, matching
+their explicit Numba signatures: enums are resolved to integer codes and
+arrays made C-contiguous by the Python wrappers before the call.
+
+Author: RWF Economic Impact Analysis Team
+"""
+
+import numpy as np
+
+try:
+    from numba import njit, prange, types
+    NUMBA_AVAILABLE = True
+    # Read-only C-contiguous float64 vector. Accepts writable arrays as well
+    # as the cached read-only tables economic_core_v4 passes in.
+    _F8_IN = types.Array(types.float64, 1, 'C', readonly=True)
+    _TRAJ_SIG = types.float64[::1](
+        types.float64, types.float64, _F8_IN, types.float64, types.float64,
+        types.float64, types.int64, types.int64
+    )
+    _TRAJ_ROWS_SIG = types.float64[:, ::1](_F8_IN, _F8_IN, _F8_IN, types.int64)
+    _MARKOV_SIG = types.int8[::1](_F8_IN, types.int64, types.float64, types.float64)
+    _DECAY_SIG = types.Tuple((types.float64[::1], types.boolean))(
+        types.int64, types.float64, types.float64
+    )
+    _APPR_SIG = types.float64[::1](
+        types.float64, types.float64, types.float64, _F8_IN, types.float64,
+        types.float64, types.float64, types.float64, types.float64, _F8_IN,
+        types.int64
+    )
+except ImportError:
+    NUMBA_AVAILABLE = False
+    prange = range
+    _TRAJ_SIG = _TRAJ_ROWS_SIG = _MARKOV_SIG = _DECAY_SIG = _APPR_SIG = None
+
+    def njit(*args, **kwargs):
+        """No-op stand-in for numba.njit when Numba is not installed."""
+        if len(args) == 1 and callable(args[0]) and not kwargs:
+            return args[0]
+        return lambda func: func
+
+
+# Integer codes for economic_core_v4.DecayFunction (IntEnum values)
+DECAY_NONE = 0
+DECAY_EXPONENTIAL = 1
+DECAY_LINEAR = 2
+
+# Integer codes for economic_core_v4.Sector (IntEnum values)
+SECTOR_FORMAL = 0
+SECTOR_INFORMAL = 1
+
+
+# Fast-math flags for the kernels: allow FMA contraction and reassociation of
+# the wage product, but NOT the 'nnan'/'ninf' assumptions -- RTE trajectories
+# pass an infinite half-life (decay rate 0) and must stay well-defined.
+_FASTMATH = {'contract', 'reassoc', 'nsz', 'arcp'}
+
+
+# ====
+# WAGE TRAJECTORY KERNEL
+# ====
+
+# Explicit signatures compile each kernel once at import (eagerly, cached to
+# disk) instead of on the first call, with contiguous (C-order) array types
+@njit(_TRAJ_SIG, cache=True, fastmath=_FASTMATH, boundscheck=False)
+def _traj_kernel(base_wage, edu_prem, experience_factors, real_growth,
+                 initial_premium, halflife, decay_code, working_years):
+    """
+    Annual wage trajectory for one (schooling, sector, demographic) pathway.
+
+    Loop form of MincerWageModel.generate_wage_trajectory():
+        W_t = base x edu_prem x exp_factor_t x (1 + premium x decay_t)
+              x (1 + g)^t x 12
+
+    Args:
+        base_wage: Region-adjusted baseline monthly wage
+        edu_prem: Education premium exp(r x (S - 12))
+        experience_factors: exp(b1*t + b2*t^2), length >= working_years
+        real_growth: Annual real wage growth rate
+        initial_premium: Initial intervention premium (proportion)
+        halflife: Premium half-life (exponential) or 2x zero-point (linear)
+        decay_code: DECAY_NONE / DECAY_EXPONENTIAL / DECAY_LINEAR
+        working_years: Number of years (T)
+
+    Returns:
+        float64 array of annual wages, length working_years
+    """
+    wages = np.empty(working_years)
+    decay_rate = np.log(2.0) / halflife
+
+    for t in range(working_years):
+        if decay_code == DECAY_EXPONENTIAL:
+            decay = np.exp(-decay_rate * t)
+        elif decay_code == DECAY_LINEAR:
+            decay = max(0.0, 1.0 - t / (2.0 * halflife))
+        else:
+            decay = 1.0
+
+        wages[t] = (base_wage * edu_prem * experience_factors[t] *
+                    (1.0 + initial_premium * decay) *
+                    (1.0 + real_growth) ** t * 12.0)
+
+    return wages
+
+
+@njit(_TRAJ_ROWS_SIG, cache=True, parallel=True, fastmath=_FASTMATH,
+      boundscheck=False)
+def _traj_rows_kernel(levels, experience_factors, real_growth, working_years):
+    """
+    Several premium-free trajectories for one demographic, rows in parallel.
+    
+    Loop form of MincerWageModel.generate_wage_trajectories_batch():
+        W[k, t] = level_k x exp_factor_t x (1 + g_k)^t x 12
+    
+    Args:
+        levels: Base wage x education premium per pathway (k,)
+        experience_factors: exp(b1*t + b2*t^2), length >= working_years
+        real_growth: Annual real wage growth per pathway (k,)
+        working_years: Number of years (T)
+    
+    Returns:
+        float64 array of annual wages shaped (k, working_years)
+    """
+    wages = np.empty((len(levels), working_years))
+    
+    for k in prange(len(levels)):
+        for t in range(working_years):
+            wages[k, t] = (levels[k] * experience_factors[t] *
+                           (1.0 + real_growth[k]) ** t * 12.0)
+    
+    return wages
+
+
+@njit(_APPR_SIG, cache=True, fastmath=_FASTMATH, boundscheck=False)
+def _apprentice_stream_kernel(stipend_annual, formal_level, informal_level,
+                              experience_factors, g_formal, g_informal,
+                              initial_premium, halflife, p_formal, employed,
+                              working_years):
+    """
+    Expected apprenticeship treatment earnings, Year 0 stipend included.
+
+    Fuses the two generate_wage_trajectory() calls, the sector blend and the
+    unemployment adjustment of calculate_treatment_trajectory() into one
+    pass over t, without the intermediate formal/informal arrays:
+        W_0     = stipend x employed_0
+        W_{t+1} = [p x W^F_t + (1 - p) x W^I_t] x employed_{t+1}
+    where W^F_t carries the exponentially decaying premium (see _traj_kernel).
+
+    Args:
+        stipend_annual: Year 0 stipend (INR/year)
+        formal_level: Formal base wage x education premium
+        informal_level: Informal base wage x education premium
+        experience_factors: exp(b1*t + b2*t^2), length >= working_years
+        g_formal: Formal-sector annual real wage growth
+        g_informal: Informal-sector annual real wage growth
+        initial_premium: Initial apprenticeship premium (proportion)
+        halflife: Premium half-life in years
+        p_formal: P(Formal | Apprenticeship)
+        employed: Employment probability per year, length working_years + 1
+        working_years: Number of working years (T), excluding Year 0
+
+    Returns:
+        float64 array of expected annual earnings, length working_years + 1
+    """
+    wages = np.empty(working_years + 1)
+    wages[0] = stipend_annual * employed[0]
+    decay_rate = np.log(2.0) / halflife
+
+    for t in range(working_years):
+        formal = (formal_level * experience_factors[t] *
+                  (1.0 + initial_premium * np.exp(-decay_rate * t)) *
+                  (1.0 + g_formal) ** t * 12.0)
+        informal = (informal_level * experience_factors[t] *
+                    (1.0 + g_informal) ** t * 12.0)
+        wages[t + 1] = ((p_formal * formal + (1.0 - p_formal) * informal) *
+                        employed[t + 1])
+
+    return wages
+
+
+@njit(_DECAY_SIG, cache=True, fastmath=_FASTMATH, boundscheck=False)
+def _decay_kernel(working_years, halflife, initial_premium):
+    """
+    Exponentially decaying apprenticeship premium and its monotonicity.
+
+    Loop form of the trajectory checked by m4_validation_qa check 5:
+        premium_t = initial_premium x 2^(-t / h)
+
+    Args:
+        working_years: Number of years (T)
+        halflife: Premium half-life h in years
+        initial_premium: Premium at t = 0
+
+    Returns:
+        (float64 array of premiums, length working_years;
+         True if no year's premium exceeds the previous year's)
+    """
+    premiums = np.empty(working_years)
+    monotonic = True
+
+    for t in range(working_years):
+        premiums[t] = initial_premium * np.exp2(-t / halflife)
+        if t > 0 and premiums[t] > premiums[t - 1]:
+            monotonic = False
+
+    return premiums, monotonic
+
+
+# ====
+# SECTOR TRANSITION KERNEL
+# ====
+
+@njit(_MARKOV_SIG, cache=True, boundscheck=False)
+def _markov_sector_kernel(u, initial_state, p_formal_stay, p_informal_to_formal):
+    """
+    Two-state (formal/informal) Markov chain driven by pre-drawn uniforms.
+
+    Args:
+        u: Uniform(0, 1) draws, one per transition (length years - 1)
+        initial_state: SECTOR_FORMAL or SECTOR_INFORMAL
+        p_formal_stay: P(Formal_t | Formal_{t-1})
+        p_informal_to_formal: P(Formal_t | Informal_{t-1})
+
+    Returns:
+        int8 array of sector codes, length len(u) + 1
+    """
+    states = np.empty(len(u) + 1, dtype=np.int8)
+    states[0] = initial_state
+
+    for t in range(len(u)):
+        if states[t] == SECTOR_FORMAL:
+            p_formal = p_formal_stay
+        else:
+            p_formal = p_informal_to_formal
+        states[t + 1] = SECTOR_FORMAL if u[t] < p_formal else SECTOR_INFORMAL
+
+    return states
@@ -65,10 +65,13 @@ Version: 4.3 (January 18, 2026)
 Status: CSV SSOT SYNC COMPLETE
 """
 
+import math
+import os
 import numpy as np
-from dataclasses import dataclass, field
-from typing import Dict, List, Optional, Tuple, Union
-from enum import Enum
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field, fields
+from typing import Callable, Dict, List, Optional, Tuple, Union
+from enum import IntEnum
 import warnings
 
 # SSOT Import: parameter_registry_v3 is the Single Source of Truth for parameters
@@ -91,56 +94,84 @@ except ImportError:
         SCENARIO_CONFIGS,
     )
 
+# Optional Numba-compiled kernels (NUMBA_AVAILABLE is False without numba)
+try:
+    from .econ_kernels import (
+        NUMBA_AVAILABLE, _traj_kernel, _traj_rows_kernel, _markov_sector_kernel,
+        _apprentice_stream_kernel
+    )
+except ImportError:
+    from econ_kernels import (
+        NUMBA_AVAILABLE, _traj_kernel, _traj_rows_kernel, _markov_sector_kernel,
+        _apprentice_stream_kernel
+    )
+
+# ln(2): converts a premium half-life h into the exponential decay rate ln(2)/h
+_LN2 = math.log(2)
+
 
 # ====
 # SECTION 1: ENUMERATIONS AND TYPE DEFINITIONS
 # ====
 
-class Gender(Enum):
-    MALE = "male"
-    FEMALE = "female"
+class _LabelledIntEnum(IntEnum):
+    """
+    IntEnum whose members double as array indices (values 0..n-1).
+    
+    `label` gives the lowercase string used in result dicts and report keys
+    (e.g. Region.SOUTH.label == "south").
+    """
+    
+    @property
+    def label(self) -> str:
+        return self.name.lower()
+
+
+class Gender(_LabelledIntEnum):
+    MALE = 0
+    FEMALE = 1
 
 
-class Location(Enum):
-    URBAN = "urban"
-    RURAL = "rural"
+class Location(_LabelledIntEnum):
+    URBAN = 0
+    RURAL = 1
 
 
-class Sector(Enum):
-    FORMAL = "formal"
-    INFORMAL = "informal"
+class Sector(_LabelledIntEnum):
+    FORMAL = 0
+    INFORMAL = 1
 
 
-class Region(Enum):
-    NORTH = "north"   # UP, Bihar, Punjab, Haryana, Delhi
-    SOUTH = "south"   # TN, Karnataka, AP, Telangana, Kerala
-    WEST = "west"    # Maharashtra, Gujarat, Goa, Rajasthan
-    EAST = "east"    # WB, Odisha, Jharkhand, Chhattisgarh
+class Region(_LabelledIntEnum):
+    NORTH = 0   # UP, Bihar, Punjab, Haryana, Delhi
+    SOUTH = 1   # TN, Karnataka, AP, Telangana, Kerala
+    WEST = 2    # Maharashtra, Gujarat, Goa, Rajasthan
+    EAST = 3    # WB, Odisha, Jharkhand, Chhattisgarh
 
 
-class Intervention(Enum):
-    RTE = "rte"    # Right to Education 25% reservation
-    APPRENTICESHIP = "apprenticeship"  # National Apprenticeship Training Scheme
+class Intervention(_LabelledIntEnum):
+    RTE = 0    # Right to Education 25% reservation
+    APPRENTICESHIP = 1  # National Apprenticeship Training Scheme
 
 
-class EducationLevel(Enum):
+class EducationLevel(IntEnum):
     PRIMARY = 5    # 5 years
     SECONDARY = 10    # 10 years
     HIGHER_SECONDARY = 12 # 12 years
     TERTIARY = 16    # 16 years
 
 
-class DecayFunction(Enum):
-    NONE = "none"    # No decay (h = infinity)
-    EXPONENTIAL = "exponential" # Exponential decay with half-life
-    LINEAR = "linear"    # Linear decay to zero
+class DecayFunction(_LabelledIntEnum):
+    NONE = 0    # No decay (h = infinity)
+    EXPONENTIAL = 1 # Exponential decay with half-life
+    LINEAR = 2    # Linear decay to zero
 
 
 # ====
 # SECTION 2: PARAMETER REGISTRY (Updated with PLFS 2023-24)
 # ====
 
-@dataclass
+@dataclass(slots=True)
 class Parameter:
     """Single parameter with metadata for Monte Carlo sampling."""
     value: float
@@ -151,27 +182,96 @@ class Parameter:
     unit: str = ""
     description: str = ""
     
-    def sample(self, distribution: str = "uniform") -> float:
-        """Sample from uncertainty distribution for Monte Carlo."""
-        if distribution == "uniform":
-            return np.random.uniform(self.min_val, self.max_val)
-        elif distribution == "triangular":
-            return np.random.triangular(self.min_val, self.value, self.max_val)
-        elif distribution == "normal":
-            std = (self.max_val - self.min_val) / 4  # 95% within range
-            return np.clip(np.random.normal(self.value, std), 
-                          self.min_val, self.max_val)
-        else:
-            return self.value
+    def sample(self, distribution: str = "uniform",
+               size: Optional[int] = None,
+               rng: np.random.Generator = None) -> Union[float, np.ndarray]:
+        """
+        Sample from uncertainty distribution for Monte Carlo.
+        
+        Returns a scalar, or an array of `size` draws when size is given.
+        Draws come from `rng` when given, else the global NumPy RNG.
+        Unknown distributions return the point value (see _SAMPLER_FNS).
+        """
+        return _SAMPLER_FNS.get(distribution, _sample_fixed)(self, size, rng)
 
 
-@dataclass
+# Samplers keyed by distribution name: (parameter, size, rng) -> draw(s).
+# rng=None falls back to the legacy global RNG (np.random module functions).
+def _sample_uniform(param: Parameter, size: Optional[int], rng=None):
+    return (rng or np.random).uniform(param.min_val, param.max_val, size)
+
+
+def _sample_triangular(param: Parameter, size: Optional[int], rng=None):
+    return (rng or np.random).triangular(
+        param.min_val, param.value, param.max_val, size
+    )
+
+
+def _sample_normal(param: Parameter, size: Optional[int], rng=None):
+    # Normal truncated to [min_val, max_val] (std = range/4) rather than
+    # clipped, which would pile probability mass onto the bounds
+    std = (param.max_val - param.min_val) / 4  # 95% within range
+    if std <= 0:
+        return _sample_fixed(param, size)
+    from scipy.stats import truncnorm
+    return truncnorm.rvs(
+        (param.min_val - param.value) / std,
+        (param.max_val - param.value) / std,
+        loc=param.value, scale=std, size=size, random_state=rng
+    )
+
+
+def _sample_fixed(param: Parameter, size: Optional[int], rng=None):
+    return param.value if size is None else np.full(size, param.value)
+
+
+_SAMPLER_FNS: Dict[str, Callable] = {
+    "uniform": _sample_uniform,
+    "triangular": _sample_triangular,
+    "normal": _sample_normal,
+}
+
+
+@dataclass(frozen=True, slots=True)
+class ParamSnapshot:
+    """
+    Plain-float copy of the registry values read on the LNPV hot path.
+    
+    Field names are the lower-case registry names. Built once per
+    calculator (LifetimeNPVCalculator.update_params) so trajectory methods
+    read floats instead of Parameter wrappers.
+    """
+    working_life_formal: float
+    labor_market_entry_age: float
+    social_discount_rate: float
+    p_formal_rte: float
+    rte_test_score_gain: float
+    test_score_to_years: float
+    p_formal_apprentice: float
+    apprentice_initial_premium: float
+    apprentice_decay_halflife: float
+    apprentice_stipend_monthly: float
+    p_formal_no_training: float
+    
+    @classmethod
+    def from_params(cls, params) -> "ParamSnapshot":
+        """Snapshot any registry-like object (ParameterRegistry or ParameterView)."""
+        return cls(*(
+            float(getattr(params, f.name.upper()).value) for f in fields(cls)
+        ))
+
+
+@dataclass(slots=True)
 class ParameterRegistry:
     """
     Centralized parameter registry with PLFS 2023-24 values.
     
     CRITICAL: These values supersede ALL previous specifications.
     Source: RWF_Parameter_Update_Nov2025.md
+    
+    Calculators snapshot the registry: after editing a registry that a
+    LifetimeNPVCalculator already uses (param.value = x), call that
+    calculator's update_params() before computing, or the edit is ignored.
     """
     
     # ----
@@ -470,13 +570,38 @@ class ParameterRegistry:
         unit="years",
         description="Typical labor market entry age"
     ))
+    
+    # Name -> Parameter map (built once in __post_init__) for lookups by name
+    _param_map: Dict[str, Parameter] = field(init=False, repr=False, compare=False)
+    
+    def __post_init__(self):
+        self._param_map = {
+            f.name: getattr(self, f.name)
+            for f in fields(self)
+            if isinstance(getattr(self, f.name, None), Parameter)
+        }
+    
+    def snapshot(self) -> ParamSnapshot:
+        """Current values as a ParamSnapshot (does not track later edits)."""
+        return ParamSnapshot.from_params(self)
+
+
+# Shared default registry for callers that only READ parameter values.
+# Code that mutates values (Monte Carlo draws, scenario overrides, tornado
+# analysis) must build its own ParameterRegistry() instead.
+_DEFAULT_REGISTRY = ParameterRegistry()
+
+
+def get_default_registry() -> ParameterRegistry:
+    """Return the shared default ParameterRegistry (treat as read-only)."""
+    return _DEFAULT_REGISTRY
 
 
 # ====
 # SECTION 3: BASELINE WAGE DATA (PLFS 2023-24)
 # ====
 
-@dataclass
+@dataclass(slots=True)
 class BaselineWages:
     """
     Baseline monthly wages in INR from PLFS 2023-24 Table 21.
@@ -503,27 +628,29 @@ class BaselineWages:
     rural_female_higher_secondary: float = 15558
     rural_female_casual: float = 7475
     
-    def get_wage(self, location: Location, gender: Gender, 
-                 education: EducationLevel, sector: Sector) -> float:
-        """
-        Get baseline monthly wage for given demographic.
-        
-        For informal sector, returns casual wage.
-        For formal sector, returns education-appropriate salaried wage.
-        """
-        prefix = f"{location.value}_{gender.value}"
-        
-        if sector == Sector.INFORMAL:
-            return getattr(self, f"{prefix}_casual")
-        
-        if education.value >= EducationLevel.HIGHER_SECONDARY.value:
-            return getattr(self, f"{prefix}_higher_secondary")
-        else:
-            return getattr(self, f"{prefix}_secondary")
-    
-    def get_wage_nested(self) -> Dict:
-        """Return nested dictionary format for programmatic access."""
-        return {
+    # Derived lookup structures (built once in __post_init__)
+    _nested_cache: Dict = field(init=False, repr=False, compare=False)
+    _wage_dict: Dict = field(init=False, repr=False, compare=False)
+    
+    def __post_init__(self):
+        # Flat (location, gender, education, sector) -> wage lookup for get_wage().
+        # Informal sector maps to the casual wage for every education level;
+        # formal sector uses the HS salaried wage for 12+ years, else secondary.
+        self._wage_dict = {}
+        for location in Location:
+            for gender in Gender:
+                prefix = f"{location.label}_{gender.label}"
+                for education in EducationLevel:
+                    if education >= EducationLevel.HIGHER_SECONDARY:
+                        formal_wage = getattr(self, f"{prefix}_higher_secondary")
+                    else:
+                        formal_wage = getattr(self, f"{prefix}_secondary")
+                    self._wage_dict[(location, gender, education, Sector.FORMAL)] = formal_wage
+                    self._wage_dict[(location, gender, education, Sector.INFORMAL)] = (
+                        getattr(self, f"{prefix}_casual")
+                    )
+        
+        self._nested_cache = {
             Location.URBAN: {
                 Gender.MALE: {
                     EducationLevel.SECONDARY: self.urban_male_secondary,
@@ -549,13 +676,32 @@ class BaselineWages:
                 }
             }
         }
+    
+    def get_wage(self, location: Location, gender: Gender, 
+                 education: EducationLevel, sector: Sector) -> float:
+        """
+        Get baseline monthly wage for given demographic.
+        
+        For informal sector, returns casual wage.
+        For formal sector, returns education-appropriate salaried wage.
+        """
+        return self._wage_dict[(location, gender, education, sector)]
+    
+    def get_wage_nested(self) -> Dict:
+        """
+        Return nested dictionary format for programmatic access.
+        
+        The dictionary is built once at construction and shared between
+        calls; treat it as read-only.
+        """
+        return self._nested_cache
 
 
 # ====
 # SECTION 4: REGIONAL ADJUSTMENTS
 # ====
 
-@dataclass
+@dataclass(slots=True)
 class RegionalParameters:
     """
     Region-specific parameter adjustments.
@@ -599,10 +745,49 @@ class RegionalParameters:
         Region.EAST: 0.80,    # Weaker formal sector
     })
     
+    # Array views of the dicts above, indexed directly by Region
+    mincer_multipliers_arr: np.ndarray = field(init=False, repr=False,
+                                               compare=False)
+    p_formal_control_multipliers_arr: np.ndarray = field(init=False, repr=False,
+                                                         compare=False)
+    p_formal_hs_arr: np.ndarray = field(init=False, repr=False, compare=False)
+    # Unweighted mean of p_formal_hs across regions (RTE regional scaling)
+    p_formal_hs_national_avg: float = field(init=False, repr=False,
+                                            compare=False)
+    
+    def __post_init__(self):
+        self.mincer_multipliers_arr = np.array(
+            [self.mincer_multipliers[region] for region in Region]
+        )
+        self.p_formal_hs_arr = np.array(
+            [self.p_formal_hs[region] for region in Region]
+        )
+        self.p_formal_hs_national_avg = (sum(self.p_formal_hs.values()) /
+                                         len(self.p_formal_hs))
+        self.p_formal_control_multipliers_arr = np.array(
+            [self.p_formal_control_multipliers[region] for region in Region]
+        )
+    
     def get_mincer_return(self, region: Region, base_return: float) -> float:
         """Get region-specific Mincer return."""
         return base_return * self.mincer_multipliers[region]
     
+    def get_mincer_return_vec(
+        self,
+        base_return: Union[float, np.ndarray]
+    ) -> np.ndarray:
+        """
+        Get Mincer returns for every region at once.
+        
+        Args:
+            base_return: National return, scalar or (n_draws,) array
+        
+        Returns:
+            (n_regions,) array, or (n_draws, n_regions) for array input;
+            index the last axis by Region.
+        """
+        return np.asarray(base_return)[..., None] * self.mincer_multipliers_arr
+    
     def get_p_formal(self, region: Region) -> float:
         """Get region-specific P(Formal | HS)."""
         return self.p_formal_hs[region]
@@ -628,7 +813,7 @@ class RegionalParameters:
 # SECTION 5: COUNTERFACTUAL SCHOOLING DISTRIBUTION
 # ====
 
-@dataclass
+@dataclass(slots=True)
 class CounterfactualDistribution:
     """
     Schooling distribution for EWS children without RTE intervention.
@@ -686,6 +871,31 @@ class CounterfactualDistribution:
             self.p_low_fee_private * p_formal_lfp +
             self.p_dropout * p_formal_dropout
         )
+    
+    def get_weighted_p_formal_by_region(
+        self,
+        region_idx: np.ndarray,
+        regional_params: RegionalParameters
+    ) -> np.ndarray:
+        """
+        Vectorized get_weighted_p_formal() over an array of regions.
+        
+        Args:
+            region_idx: Integer array of Region values
+            regional_params: Source of the control-group regional multipliers
+        
+        Returns:
+            Array of region-adjusted weighted P(Formal), same shape as region_idx
+        """
+        multipliers = regional_params.p_formal_control_multipliers_arr[region_idx]
+        
+        # Pathway multipliers are shared, so the weighted sum factors out
+        weighted_national = (
+            self.p_government_school * self.p_formal_government +
+            self.p_low_fee_private * self.p_formal_low_fee_private +
+            self.p_dropout * self.p_formal_dropout
+        )
+        return weighted_national * multipliers
 
 
 # ====
@@ -708,51 +918,187 @@ class MincerWageModel:
     
     def __init__(self, params: ParameterRegistry = None, 
                  baseline_wages: BaselineWages = None,
-                 regional_params: RegionalParameters = None):
-        self.params = params or ParameterRegistry()
+                 regional_params: RegionalParameters = None,
+                 experience_factors: np.ndarray = None,
+                 dtype: type = np.float64):
+        self.params = params or get_default_registry()
         self.baseline_wages = baseline_wages or BaselineWages()
         self.regional = regional_params or RegionalParameters()
+        # Optional precomputed exp(b1*t + b2*t^2) for t = 0, 1, ... (see
+        # MonteCarloSimulator.build_draw_tables); computed from the coefficients when None
+        self.experience_factors = experience_factors
+        # Floating-point type of generated trajectories. float64 by default;
+        # the Monte Carlo driver passes float32 to halve memory traffic
+        # (NPVs are still accumulated in float64 by LifetimeNPVCalculator).
+        self.dtype = dtype
+        # exp(b1*t + b2*t^2) computed from the registry coefficients, keyed on
+        # (b1, b2) so an edited registry simply misses the cache
+        self._experience_cache: Dict[Tuple[float, float], np.ndarray] = {}
+        # Memo of _get_base_components() keyed on the categorical inputs and
+        # the registry MINCER_RETURN_HS value (the only registry value it
+        # reads), so an edited Mincer return simply misses the cache
+        self._base_cache: Dict[Tuple, Tuple[float, float]] = {}
+        # Memo of _demographic_base_wages() keyed on (sector, demographics)
+        self._demographic_cache: Dict[Tuple, Tuple[np.ndarray, ...]] = {}
+        # Premium decay profiles keyed on (decay function, half-life)
+        self._decay_cache: Dict[Tuple[DecayFunction, float], np.ndarray] = {}
+        # Real wage growth profiles (1 + g)^t keyed on g
+        self._growth_cache: Dict[float, np.ndarray] = {}
+    
+    def update_params(
+        self,
+        params: ParameterRegistry,
+        experience_factors: np.ndarray = None
+    ) -> None:
+        """
+        Switch this model to another registry (e.g. the next Monte Carlo draw).
+        
+        Registry-dependent caches (_base_cache, experience, growth) are keyed
+        on the values they read, so in-place edits to self.params are picked
+        up by this model without a refresh; clearing _base_cache here only
+        bounds its size. The owning LifetimeNPVCalculator, however, snapshots
+        its registry: after an in-place edit call its update_params(), which
+        also refreshes this model.
+        """
+        self.params = params
+        self.experience_factors = experience_factors
+        self._base_cache.clear()
     
-    def calculate_wage(
+    def _get_experience_factors(self, working_years: int) -> np.ndarray:
+        """
+        Experience factors exp(b1*t + b2*t^2) for t = 0..working_years-1.
+        
+        Uses the precomputed experience_factors table when it covers the
+        horizon, else the registry coefficients (read-only, cached).
+        """
+        if (self.experience_factors is not None
+                and len(self.experience_factors) >= working_years):
+            return self.experience_factors[:working_years]
+        
+        key = (self.params.EXPERIENCE_LINEAR.value, self.params.EXPERIENCE_QUAD.value)
+        factors = self._experience_cache.get(key)
+        if factors is None or len(factors) < working_years:
+            exp_coef1, exp_coef2 = key
+            t = np.arange(working_years, dtype=self.dtype)
+            factors = np.exp(exp_coef1 * t + exp_coef2 * t * t)
+            factors.flags.writeable = False
+            self._experience_cache[key] = factors
+        return factors[:working_years]
+    
+    def _premium_decay(
+        self,
+        premium_decay: DecayFunction,
+        decay_halflife: float,
+        working_years: int
+    ) -> np.ndarray:
+        """
+        Premium decay profile decay_t for t = 0..working_years-1 (read-only, cached).
+        
+        Exponential: exp(-ln2 x t / h); linear: max(0, 1 - t / 2h). Depends
+        only on (premium_decay, decay_halflife), so each profile is built once
+        per model instead of on every generate_wage_trajectory() call.
+        """
+        key = (premium_decay, decay_halflife)
+        decay = self._decay_cache.get(key)
+        if decay is None or len(decay) < working_years:
+            t = np.arange(working_years, dtype=self.dtype)
+            if premium_decay == DecayFunction.EXPONENTIAL:
+                decay = np.exp(-(_LN2 / decay_halflife) * t)
+            else:
+                decay = np.maximum(0.0, 1 - t / (2 * decay_halflife))
+            decay.flags.writeable = False
+            self._decay_cache[key] = decay
+        return decay[:working_years]
+    
+    def _growth_factors(self, real_wage_growth: float, working_years: int) -> np.ndarray:
+        """
+        Real wage growth profile (1 + g)^t for t = 0..working_years-1 (read-only, cached).
+        
+        Only two growth rates (formal, informal) are in use per registry, so
+        the power is evaluated once per rate rather than on every trajectory.
+        """
+        growth = self._growth_cache.get(real_wage_growth)
+        if growth is None or len(growth) < working_years:
+            t = np.arange(working_years, dtype=self.dtype)
+            growth = (1 + real_wage_growth) ** t
+            growth.flags.writeable = False
+            self._growth_cache[real_wage_growth] = growth
+        return growth[:working_years]
+    
+    def _demographic_base_wages(
+        self,
+        sector: Sector,
+        demographics: List[Tuple[Gender, Location, Region]]
+    ) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """
+        Region-adjusted HS and secondary base wages per demographic cell.
+        
+        Pure function of (sector, demographics), memoized like
+        _categorical_base() so repeated generate_wage_tensor() calls over the
+        same cells skip the per-cell wage and regional lookups.
+        
+        Returns:
+            Read-only (base_hs, base_secondary, region_idx), each (n_demo,)
+        """
+        key = (sector, tuple(demographics))
+        arrays = self._demographic_cache.get(key)
+        if arrays is None:
+            arrays = tuple(
+                np.array([
+                    self.regional.adjust_wage(
+                        self.baseline_wages.get_wage(location, gender, level, sector),
+                        region
+                    )
+                    for gender, location, region in demographics
+                ])
+                for level in (EducationLevel.HIGHER_SECONDARY, EducationLevel.SECONDARY)
+            ) + (np.array([region for _, _, region in demographics]),)
+            for array in arrays:
+                array.flags.writeable = False
+            self._demographic_cache[key] = arrays
+        return arrays
+    
+    def _categorical_base(
         self,
         years_schooling: float,
-        experience: float,
         sector: Sector,
         gender: Gender,
         location: Location,
-        region: Region = Region.WEST,
-        additional_premium: float = 0.0
-    ) -> float:
+        region: Region
+    ) -> Tuple[float, float]:
+        """Memoized _get_base_components() (see _base_cache)."""
+        key = (years_schooling, sector, gender, location, region,
+               self.params.MINCER_RETURN_HS.value)
+        components = self._base_cache.get(key)
+        if components is None:
+            components = self._get_base_components(
+                years_schooling, sector, gender, location, region
+            )
+            self._base_cache[key] = components
+        return components
+    
+    def _get_base_components(
+        self,
+        years_schooling: float,
+        sector: Sector,
+        gender: Gender,
+        location: Location,
+        region: Region
+    ) -> Tuple[float, float]:
         """
-        Calculate monthly wage using Mincer equation.
-        
-        Args:
-            years_schooling: Years of education completed
-            experience: Years of work experience
-            sector: Formal or informal
-            gender: Male or female
-            location: Urban or rural
-            region: Geographic region (North/South/East/West)
-            additional_premium: Any intervention-specific premium (proportional)
+        Return the experience-invariant part of the Mincer wage.
         
         Returns:
-            Monthly wage in INR
+            Tuple of (region-adjusted base monthly wage, education premium)
         """
         # Get region-adjusted Mincer return
         base_return = self.params.MINCER_RETURN_HS.value
         mincer_return = self.regional.get_mincer_return(region, base_return)
         
-        # Get experience coefficients (CORRECTED VALUES)
-        exp_coef1 = self.params.EXPERIENCE_LINEAR.value    # 0.00885
-        exp_coef2 = self.params.EXPERIENCE_QUAD.value    # -0.000123
-        
         # Education premium (relative to baseline education level of 12 years)
         education_years_diff = years_schooling - 12
         education_premium = np.exp(mincer_return * education_years_diff)
         
-        # Experience premium (inverted U-shape)
-        experience_premium = np.exp(exp_coef1 * experience + exp_coef2 * experience**2)
-        
         # Get baseline wage for demographic
         education_level = (EducationLevel.HIGHER_SECONDARY 
                           if years_schooling >= 12 
@@ -765,6 +1111,46 @@ class MincerWageModel:
         # Apply regional adjustment
         base_wage = self.regional.adjust_wage(base_wage, region)
         
+        return base_wage, education_premium
+    
+    def calculate_wage(
+        self,
+        years_schooling: float,
+        experience: float,
+        sector: Sector,
+        gender: Gender,
+        location: Location,
+        region: Region = Region.WEST,
+        additional_premium: float = 0.0,
+        experience_premium: float = None
+    ) -> float:
+        """
+        Calculate monthly wage using Mincer equation.
+        
+        Args:
+            years_schooling: Years of education completed
+            experience: Years of work experience
+            sector: Formal or informal
+            gender: Male or female
+            location: Urban or rural
+            region: Geographic region (North/South/East/West)
+            additional_premium: Any intervention-specific premium (proportional)
+            experience_premium: Precomputed experience factor for this
+                experience level (computed from the coefficients if None)
+        
+        Returns:
+            Monthly wage in INR
+        """
+        base_wage, education_premium = self._categorical_base(
+            years_schooling, sector, gender, location, region
+        )
+        
+        # Experience premium (inverted U-shape)
+        if experience_premium is None:
+            exp_coef1 = self.params.EXPERIENCE_LINEAR.value    # 0.00885
+            exp_coef2 = self.params.EXPERIENCE_QUAD.value    # -0.000123
+            experience_premium = np.exp(exp_coef1 * experience + exp_coef2 * experience**2)
+        
         # =====================================================================
         # ELIMINATED Jan 20, 2026: benefits_adjustment REMOVED per Anand guidance
         # =====================================================================
@@ -816,6 +1202,10 @@ class MincerWageModel:
         """
         Generate complete wage trajectory over working life.
         
+        Vectorized over years: only the experience, premium-decay and growth
+        terms vary with t, so they are built as arrays over t = 0..T-1 and
+        combined with the constant base wage and education premium.
+        
         Args:
             years_schooling: Years of education
             sector: Employment sector
@@ -840,39 +1230,170 @@ class MincerWageModel:
             else:
                 real_wage_growth = self.params.REAL_WAGE_GROWTH_INFORMAL.value  # -0.2%
         
-        wages = np.zeros(working_years)
+        base_wage, education_premium = self._categorical_base(
+            years_schooling, sector, gender, location, region
+        )
         
-        for t in range(working_years):
-            # Calculate decay factor for intervention premium
-            if premium_decay == DecayFunction.NONE:
-                decay_factor = 1.0
-            elif premium_decay == DecayFunction.EXPONENTIAL:
-                decay_factor = np.exp(-np.log(2) / decay_halflife * t)
-            elif premium_decay == DecayFunction.LINEAR:
-                decay_factor = max(0, 1 - t / (2 * decay_halflife))
-            else:
-                decay_factor = 1.0
-            
-            current_premium = initial_premium * decay_factor
-            
-            # Calculate monthly wage
-            monthly_wage = self.calculate_wage(
-                years_schooling=years_schooling,
-                experience=t,
-                sector=sector,
-                gender=gender,
-                location=location,
-                region=region,
-                additional_premium=current_premium
+        experience_premium = self._get_experience_factors(working_years)
+        
+        if NUMBA_AVAILABLE:
+            # Compiled loop kernel (enums passed as integer codes)
+            return _traj_kernel(
+                float(base_wage), float(education_premium),
+                np.ascontiguousarray(experience_premium, dtype=np.float64),
+                float(real_wage_growth), float(initial_premium),
+                float(decay_halflife), int(premium_decay), working_years
+            ).astype(self.dtype, copy=False)
+        
+        # Intervention premium factor (1 + premium x decay_t), decay_t cached
+        if premium_decay in (DecayFunction.EXPONENTIAL, DecayFunction.LINEAR):
+            premium_factor = 1 + initial_premium * self._premium_decay(
+                premium_decay, decay_halflife, working_years
             )
-            
-            # Apply real wage growth
-            monthly_wage *= (1 + real_wage_growth) ** t
-            
-            # Annual wage
-            wages[t] = monthly_wage * 12
+        else:
+            premium_factor = 1 + initial_premium  # No decay: constant
+        
+        # Apply real wage growth (cached per growth rate)
+        growth = self._growth_factors(real_wage_growth, working_years)
+        
+        # Annual wage (level cast first so the array arithmetic stays in dtype)
+        level = self.dtype(base_wage * education_premium)
+        return (level * experience_premium *
+                premium_factor * growth * 12).astype(self.dtype, copy=False)
+    
+    def generate_wage_trajectories_batch(
+        self,
+        years_schooling_arr: np.ndarray,
+        sectors_arr: List[Sector],
+        gender: Gender,
+        location: Location,
+        region: Region = Region.WEST,
+        working_years: int = 40
+    ) -> np.ndarray:
+        """
+        Generate several premium-free wage trajectories for one demographic.
+        
+        Row k equals generate_wage_trajectory(years_schooling_arr[k],
+        sectors_arr[k], gender, location, region, working_years) with the
+        sector-specific real wage growth. The per-pathway level (base wage x
+        education premium) and growth rate are gathered into (k, 1) columns
+        and broadcast against the shared (T,) experience profile.
+        
+        Returns:
+            Array of annual wages shaped (len(years_schooling_arr), working_years)
+        """
+        levels = np.empty(len(sectors_arr), dtype=self.dtype)
+        growth_rates = np.empty(len(sectors_arr), dtype=self.dtype)
+        for k, (years_schooling, sector) in enumerate(zip(years_schooling_arr,
+                                                          sectors_arr)):
+            base_wage, education_premium = self._categorical_base(
+                years_schooling, sector, gender, location, region
+            )
+            levels[k] = base_wage * education_premium
+            if sector == Sector.FORMAL:
+                growth_rates[k] = self.params.REAL_WAGE_GROWTH_FORMAL.value
+            else:
+                growth_rates[k] = self.params.REAL_WAGE_GROWTH_INFORMAL.value
+        
+        experience_premium = self._get_experience_factors(working_years)
+        
+        if NUMBA_AVAILABLE:
+            # Compiled kernel, one pathway per parallel iteration
+            return _traj_rows_kernel(
+                levels.astype(np.float64),
+                np.ascontiguousarray(experience_premium, dtype=np.float64),
+                growth_rates.astype(np.float64), working_years
+            ).astype(self.dtype, copy=False)
+        
+        growth = np.stack([
+            self._growth_factors(g, working_years) for g in growth_rates
+        ])
+        return (levels[:, None] * experience_premium * growth * 12).astype(
+            self.dtype, copy=False
+        )
+    
+    def generate_wage_tensor(
+        self,
+        years_schooling: Union[float, np.ndarray],
+        sector: Sector,
+        demographics: List[Tuple[Gender, Location, Region]],
+        mincer_return: Union[float, np.ndarray] = None,
+        real_wage_growth: Union[float, np.ndarray] = None,
+        experience_factors: np.ndarray = None,
+        working_years: int = 40,
+        initial_premium: Union[float, np.ndarray] = 0.0,
+        decay_halflife: Union[float, np.ndarray] = None
+    ) -> np.ndarray:
+        """
+        Generate wage trajectories for many draws and demographics at once.
+        
+        Batched equivalent of generate_wage_trajectory(): per-draw parameters
+        are broadcast against per-demographic base wages and regional
+        multipliers, so the full grid is one NumPy expression.
+        
+        Args:
+            years_schooling: Years of education (scalar or per draw)
+            sector: Employment sector
+            demographics: List of (gender, location, region) tuples
+            mincer_return: National Mincer return (scalar or per draw);
+                defaults to MINCER_RETURN_HS
+            real_wage_growth: Annual real wage growth (scalar or per draw);
+                defaults to the sector-specific registry rate
+            experience_factors: exp(b1*t + b2*t^2) as (T,) or (n_draws, T);
+                computed from the registry coefficients if None
+            working_years: Total years of work (T)
+            initial_premium: Initial intervention premium (scalar or per draw)
+            decay_halflife: Half-life for exponential premium decay (scalar or
+                per draw); premium does not decay if None
+        
+        Returns:
+            Array of annual wages shaped (n_draws, n_demographics, T)
+        """
+        if mincer_return is None:
+            mincer_return = self.params.MINCER_RETURN_HS.value
+        if real_wage_growth is None:
+            if sector == Sector.FORMAL:
+                real_wage_growth = self.params.REAL_WAGE_GROWTH_FORMAL.value
+            else:
+                real_wage_growth = self.params.REAL_WAGE_GROWTH_INFORMAL.value
+        
+        t = np.arange(working_years)
+        if experience_factors is None:
+            experience_factors = self._get_experience_factors(working_years)
+        experience_factors = np.atleast_2d(experience_factors)[:, :working_years]
+        
+        # Per-draw parameters as (n_draws, 1) columns
+        years_schooling = np.atleast_1d(np.asarray(years_schooling, dtype=float))[:, None]
+        mincer_return = np.atleast_1d(np.asarray(mincer_return, dtype=float))[:, None]
+        real_wage_growth = np.atleast_1d(np.asarray(real_wage_growth, dtype=float))[:, None]
+        initial_premium = np.atleast_1d(np.asarray(initial_premium, dtype=float))[:, None]
+        
+        # Per-demographic base wages and region indices, shape (n_demo,)
+        base_hs, base_secondary, region_idx = self._demographic_base_wages(
+            sector, demographics
+        )
+        
+        # Demographic level: base wage x education premium, shape (n_draws, n_demo)
+        base_wage = np.where(years_schooling >= 12, base_hs, base_secondary)
+        regional_return = self.regional.get_mincer_return_vec(mincer_return[:, 0])
+        education_premium = np.exp(
+            regional_return[:, region_idx] * (years_schooling - 12)
+        )
+        level = base_wage * education_premium
+        
+        # Time profile: experience x premium decay x real growth, shape (n_draws, T)
+        if decay_halflife is None:
+            premium = initial_premium
+        else:
+            decay_halflife = np.atleast_1d(np.asarray(decay_halflife, dtype=float))[:, None]
+            premium = initial_premium * np.exp(-_LN2 / decay_halflife * t)
+        profile = experience_factors * (1 + premium) * (1 + real_wage_growth) ** t
         
-        return wages
+        # Per-draw factors are small and stay float64; the full
+        # (n_draws, n_demo, T) product is formed directly in self.dtype
+        level = (level * 12).astype(self.dtype, copy=False)
+        profile = profile.astype(self.dtype, copy=False)
+        return level[:, :, None] * profile[:, None, :]
 
 
 # ====
@@ -885,7 +1406,7 @@ class EmploymentModel:
     """
     
     def __init__(self, params: ParameterRegistry = None):
-        self.params = params or ParameterRegistry()
+        self.params = params or get_default_registry()
         
         # Age-specific unemployment rates (approximate from PLFS)
         self.unemployment_by_age = {
@@ -894,6 +1415,15 @@ class EmploymentModel:
             (36, 55): 0.04,   # Mid-career: 4%
             (56, 65): 0.08,   # Near retirement: 8%
         }
+        
+        # Age-indexed rate tables built from unemployment_by_age (ages 0-99,
+        # default 5%), with the HS+ education adjustment pre-applied.
+        # Buckets are filled in reverse so the first matching bucket wins,
+        # as in get_unemployment_rate().
+        self._rate_by_age = np.full(100, 0.05)
+        for (min_age, max_age), rate in reversed(list(self.unemployment_by_age.items())):
+            self._rate_by_age[min_age:max_age + 1] = rate
+        self._rate_by_age_edu12 = self._rate_by_age * 0.9
     
     def get_unemployment_rate(self, age: int, education: EducationLevel) -> float:
         """
@@ -901,24 +1431,33 @@ class EmploymentModel:
         
         Higher education slightly reduces unemployment.
         """
-        base_rate = 0.05  # Default
+        # Education adjustment (modest effect): 10% reduction for HS+,
+        # pre-applied in _rate_by_age_edu12
+        rate_by_age = (self._rate_by_age_edu12 if education >= 12
+                       else self._rate_by_age)
         
-        for (min_age, max_age), rate in self.unemployment_by_age.items():
-            if min_age <= age <= max_age:
-                base_rate = rate
-                break
+        if 0 <= age < len(rate_by_age):
+            return float(rate_by_age[int(age)])
         
-        # Education adjustment (modest effect)
-        if education.value >= 12:
-            base_rate *= 0.9  # 10% reduction for HS+
-        
-        return base_rate
+        return 0.05 * 0.9 if education >= 12 else 0.05  # Default
     
     def get_employment_probability(self, age: int, 
                                    education: EducationLevel) -> float:
         """Get probability of being employed."""
         return 1 - self.get_unemployment_rate(age, education)
     
+    def employment_factors(
+        self,
+        n_years: int,
+        entry_age: int = 22,
+        education: EducationLevel = EducationLevel.HIGHER_SECONDARY
+    ) -> np.ndarray:
+        """Employment probability for each of n_years years since entry (float64)."""
+        rate_by_age = (self._rate_by_age_edu12 if education >= 12
+                       else self._rate_by_age)
+        ages = np.minimum(entry_age + np.arange(n_years), len(rate_by_age) - 1)
+        return 1 - rate_by_age[ages]
+    
     def apply_unemployment_shock(
         self,
         wages: np.ndarray,
@@ -929,15 +1468,15 @@ class EmploymentModel:
         Apply unemployment probability to wage trajectory.
         
         Returns expected earnings accounting for unemployment risk.
+        The last axis of `wages` is years since entry, so stacked
+        (..., T) trajectories are adjusted in one call.
         """
-        adjusted_wages = np.zeros_like(wages)
+        # Keep float32 trajectories in float32 (the rate table is float64)
+        employed = self.employment_factors(
+            np.shape(wages)[-1], entry_age, education
+        ).astype(np.result_type(wages, np.float32), copy=False)
         
-        for t, wage in enumerate(wages):
-            age = entry_age + t
-            p_employed = self.get_employment_probability(age, education)
-            adjusted_wages[t] = wage * p_employed
-        
-        return adjusted_wages
+        return wages * employed
 
 
 # ====
@@ -971,31 +1510,24 @@ class SectorTransitionModel:
         Simulate sector trajectory over working life.
         
         If absorbing=True, returns initial sector for all years.
-        If absorbing=False, simulates Markov transitions.
-        """
-        if seed is not None:
-            np.random.seed(seed)
-        
-        trajectory = [initial_sector]
+        If absorbing=False, simulates Markov transitions: all uniforms are
+        drawn in one call and the chain is stepped over integer sector codes
+        (econ_kernels._markov_sector_kernel), mapping back to Sector at the end.
         
+        Draws come from a per-call np.random.Generator (seeded when `seed` is
+        given), so the global NumPy RNG state is never touched.
+        """
         if self.absorbing:
             return [initial_sector] * years
         
-        for t in range(1, years):
-            current = trajectory[-1]
-            
-            if current == Sector.FORMAL:
-                next_sector = (Sector.FORMAL 
-                             if np.random.random() < self.p_formal_stay 
-                             else Sector.INFORMAL)
-            else:
-                next_sector = (Sector.FORMAL 
-                             if np.random.random() < self.p_informal_to_formal 
-                             else Sector.INFORMAL)
-            
-            trajectory.append(next_sector)
+        rng = np.random.default_rng(seed)
+        u = rng.random(max(years - 1, 0))
+        states = _markov_sector_kernel(
+            u, int(initial_sector),
+            float(self.p_formal_stay), float(self.p_informal_to_formal)
+        )
         
-        return trajectory
+        return [Sector(code) for code in states]
     
     def get_expected_formal_years(
         self,
@@ -1054,6 +1586,12 @@ class LifetimeNPVCalculator:
     IMPORTANT: This is NOT "ignoring inflation" - it's using current prices as
     the reference frame, which is standard practice for long-term cost-benefit
     analysis when comparing multiple interventions with different time horizons.
+    
+    REGISTRY EDITS: Parameter values are snapshotted (self._ps) at construction
+    and by update_params(). In-place edits to self.params are NOT seen until
+    update_params() is called; update_params(registry) switches to another
+    registry. Both forms also refresh the wage and employment models, giving
+    the same results as a new LifetimeNPVCalculator(params=registry).
     """
     
     def __init__(
@@ -1064,11 +1602,60 @@ class LifetimeNPVCalculator:
         sector_model: SectorTransitionModel = None,
         counterfactual: CounterfactualDistribution = None
     ):
-        self.params = params or ParameterRegistry()
+        self.params = params or get_default_registry()
         self.wage_model = wage_model or MincerWageModel(self.params)
         self.employment_model = employment_model or EmploymentModel(self.params)
         self.sector_model = sector_model or SectorTransitionModel(absorbing=True)
         self.counterfactual = counterfactual or CounterfactualDistribution()
+        
+        # Discount factors (1 + r)^-t memoized per rate
+        self._discount_cache: Dict[float, np.ndarray] = {}
+        self.update_params()
+        
+        # Region-adjusted control-group P(Formal) per counterfactual pathway;
+        # depends only on (region, pathway), so tabulated once per calculator
+        adjust = self.wage_model.regional.adjust_p_formal_control
+        self._p_formal_ctrl: Dict[Region, Dict[str, float]] = {
+            region: {
+                'govt': adjust(region, self.counterfactual.p_formal_government),
+                'lfp': adjust(region, self.counterfactual.p_formal_low_fee_private),
+                'dropout': adjust(region, self.counterfactual.p_formal_dropout),
+            }
+            for region in Region
+        }
+    
+    def update_params(self, params: ParameterRegistry = None) -> None:
+        """
+        Refresh the values this calculator caches from its registry.
+        
+        Values used by the trajectory methods are snapshotted here as plain
+        floats (self._ps) rather than read from Parameter objects on every
+        call. Call after modifying self.params in place, or pass a new
+        registry to switch to it; the wage and employment models are
+        re-pointed at the same registry (the wage model keeps its
+        experience_factors table).
+        """
+        if params is not None:
+            self.params = params
+        
+        self.wage_model.update_params(self.params, self.wage_model.experience_factors)
+        self.employment_model.params = self.params
+        self._ps = self.params.snapshot()
+        self._working_years = int(self._ps.working_life_formal)
+        self._entry_age = int(self._ps.labor_market_entry_age)
+        
+        # Precompute the registry rate to cover Year 0 + working life
+        # (apprenticeship streams)
+        self._get_discount(self._ps.social_discount_rate, self._working_years + 2)
+    
+    def _get_discount(self, discount_rate: float, n_years: int) -> np.ndarray:
+        """Return (1 + discount_rate)^-t for t = 0..n_years-1 (read-only, cached)."""
+        factors = self._discount_cache.get(discount_rate)
+        if factors is None or len(factors) < n_years:
+            factors = (1 + discount_rate) ** -np.arange(n_years)
+            factors.flags.writeable = False
+            self._discount_cache[discount_rate] = factors
+        return factors[:n_years]
     
     def calculate_treatment_trajectory(
         self,
@@ -1093,15 +1680,16 @@ class LifetimeNPVCalculator:
             # - regional scaling still applies (urban areas have higher formal %)
             #
             # Anand guidance: "70% too high, 30-40% defensible"
-            base_p_formal = self.params.P_FORMAL_RTE.value  # 0.30 (NEW: RTE-specific)
-            regional_p = self.wage_model.regional.p_formal_hs[region]
-            national_avg = sum(self.wage_model.regional.p_formal_hs.values()) / 4
+            base_p_formal = self._ps.p_formal_rte  # 0.30 (NEW: RTE-specific)
+            regional = self.wage_model.regional
+            regional_p = float(regional.p_formal_hs_arr[region])
+            national_avg = regional.p_formal_hs_national_avg
             regional_multiplier = regional_p / national_avg
             p_formal = min(0.90, base_p_formal * regional_multiplier)  # Cap at 90%
 
             # RTE: Effective years of schooling increased by test score gains
-            years_schooling = 12 + (self.params.RTE_TEST_SCORE_GAIN.value *
-                                   self.params.TEST_SCORE_TO_YEARS.value)
+            years_schooling = 12 + (self._ps.rte_test_score_gain *
+                                   self._ps.test_score_to_years)
             initial_premium = 0  # Premium captured in education effect
             decay = DecayFunction.NONE
             halflife = float('inf')
@@ -1112,7 +1700,7 @@ class LifetimeNPVCalculator:
             # adjustments. This reflects that placement is through specific employers
             # (MSDE data) rather than general labor markets, so absorption rates are
             # more uniform nationally.
-            p_formal = self.params.P_FORMAL_APPRENTICE.value
+            p_formal = self._ps.p_formal_apprentice
             
             years_schooling = 12
             
@@ -1124,20 +1712,28 @@ class LifetimeNPVCalculator:
             # NOTE: Back-of-envelope calculation in documentation gives ~â‚¹235k/year
             # premium, but we intentionally use conservative â‚¹84k for modeling.
             # Sensitivity range [â‚¹50k, â‚¹120k] is captured in parameter min/max values.
-            initial_premium = (self.params.APPRENTICE_INITIAL_PREMIUM.value / 
+            initial_premium = (self._ps.apprentice_initial_premium / 
                               (12 * 20000))
             
             decay = DecayFunction.EXPONENTIAL
-            halflife = self.params.APPRENTICE_DECAY_HALFLIFE.value
+            halflife = self._ps.apprentice_decay_halflife
             
             # YEAR 0 IMPLEMENTATION (Open Loop OL-03 - Dec 2025):
             # During the 1-year apprenticeship training, participant receives stipend
             # rather than full wage. This creates an opportunity cost that reduces NPV.
             
             # Calculate Year 0 stipend (treatment group receives this)
-            year_0_stipend_annual = self.params.APPRENTICE_STIPEND_MONTHLY.value * 12
+            year_0_stipend_annual = self._ps.apprentice_stipend_monthly * 12
         
-        working_years = int(self.params.WORKING_LIFE_FORMAL.value)
+        working_years = self._working_years
+        
+        if NUMBA_AVAILABLE and intervention == Intervention.APPRENTICESHIP:
+            # Compiled kernel: both sector trajectories, the blend and the
+            # unemployment adjustment in a single loop over years
+            return self._apprentice_stream_compiled(
+                gender, location, region, year_0_stipend_annual,
+                initial_premium, halflife, p_formal
+            ), p_formal
         
         # Generate trajectories for formal and informal pathways
         formal_wages = self.wage_model.generate_wage_trajectory(
@@ -1164,16 +1760,18 @@ class LifetimeNPVCalculator:
         )
         
         # Expected wages = weighted by sector probability
-        expected_wages = p_formal * formal_wages + (1 - p_formal) * informal_wages
-        
-        # For apprenticeship: prepend Year 0 stipend to the trajectory
-        # This extends the trajectory from 40 to 41 years (Year 0 + Years 1-40)
+        # For apprenticeship: Year 0 stipend precedes the working-life wages,
+        # extending the trajectory from 40 to 41 years (Year 0 + Years 1-40).
+        # Both are written into one preallocated buffer (no prepend copy).
         if intervention == Intervention.APPRENTICESHIP:
-            expected_wages = np.concatenate([[year_0_stipend_annual], expected_wages])
+            expected_wages = np.empty(working_years + 1, dtype=formal_wages.dtype)
+            expected_wages[0] = year_0_stipend_annual
+            expected_wages[1:] = p_formal * formal_wages + (1 - p_formal) * informal_wages
             # Adjust entry age to reflect training year (age 18-20 typical for apprentice start)
-            entry_age = int(self.params.LABOR_MARKET_ENTRY_AGE.value) - 1
+            entry_age = self._entry_age - 1
         else:
-            entry_age = int(self.params.LABOR_MARKET_ENTRY_AGE.value)
+            expected_wages = p_formal * formal_wages + (1 - p_formal) * informal_wages
+            entry_age = self._entry_age
         
         # Apply unemployment probability
         expected_wages = self.employment_model.apply_unemployment_shock(
@@ -1183,6 +1781,45 @@ class LifetimeNPVCalculator:
         
         return expected_wages, p_formal
     
+    def _apprentice_stream_compiled(
+        self,
+        gender: Gender,
+        location: Location,
+        region: Region,
+        stipend_annual: float,
+        initial_premium: float,
+        halflife: float,
+        p_formal: float
+    ) -> np.ndarray:
+        """
+        Apprenticeship treatment stream via econ_kernels._apprentice_stream_kernel.
+        
+        Same result as the generate_wage_trajectory() path of
+        calculate_treatment_trajectory(); only called when Numba is available.
+        """
+        wage_model = self.wage_model
+        working_years = self._working_years
+        formal_base, formal_edu = wage_model._categorical_base(
+            12, Sector.FORMAL, gender, location, region
+        )
+        informal_base, informal_edu = wage_model._categorical_base(
+            12, Sector.INFORMAL, gender, location, region
+        )
+        employed = self.employment_model.employment_factors(
+            working_years + 1, entry_age=self._entry_age - 1
+        )
+        return _apprentice_stream_kernel(
+            float(stipend_annual),
+            float(formal_base * formal_edu), float(informal_base * informal_edu),
+            np.ascontiguousarray(
+                wage_model._get_experience_factors(working_years), dtype=np.float64
+            ),
+            float(wage_model.params.REAL_WAGE_GROWTH_FORMAL.value),
+            float(wage_model.params.REAL_WAGE_GROWTH_INFORMAL.value),
+            float(initial_premium), float(halflife), float(p_formal),
+            employed, working_years
+        ).astype(wage_model.dtype, copy=False)
+    
     def calculate_control_trajectory(
         self,
         gender: Gender,
@@ -1199,86 +1836,46 @@ class LifetimeNPVCalculator:
         overstatement of treatment effects in high-formal regions (e.g., South) and
         understatement in low-formal regions (e.g., East).
         """
-        working_years = int(self.params.WORKING_LIFE_FORMAL.value)
-        
-        # Calculate weighted average across counterfactual pathways
-        total_wages = np.zeros(working_years)
+        working_years = self._working_years
         
         # UPDATED: Apply regional adjustment to all control P(Formal) values
-        # Government school pathway (national average: 0.12, region-adjusted)
-        p_formal_govt = self.wage_model.regional.adjust_p_formal_control(
-            region, self.counterfactual.p_formal_government
-        )
-        govt_formal = self.wage_model.generate_wage_trajectory(
-            years_schooling=10,  # Secondary completion
-            sector=Sector.FORMAL,
-            gender=gender,
-            location=location,
-            region=region,
-            working_years=working_years
-        )
-        govt_informal = self.wage_model.generate_wage_trajectory(
-            years_schooling=10,
-            sector=Sector.INFORMAL,
+        # Government school (0.12), low-fee private (0.15) and dropout (0.05)
+        # national averages, region-adjusted (precomputed in __init__)
+        p_formal_ctrl = self._p_formal_ctrl[region]
+        p_formal_vec = np.array([
+            p_formal_ctrl['govt'], p_formal_ctrl['lfp'], p_formal_ctrl['dropout']
+        ])
+        pathway_weights = np.array([
+            self.counterfactual.p_government_school,
+            self.counterfactual.p_low_fee_private,
+            self.counterfactual.p_dropout,
+        ])
+        
+        # All six pathway trajectories in one batch, viewed as
+        # (pathway, sector, T) = (govt/lfp/dropout, formal/informal, T):
+        # secondary completion (10), partial HS (11), primary only (5)
+        pathway_wages = self.wage_model.generate_wage_trajectories_batch(
+            years_schooling_arr=np.array([10, 10, 11, 11, 5, 5]),
+            sectors_arr=[Sector.FORMAL, Sector.INFORMAL] * 3,
             gender=gender,
             location=location,
             region=region,
             working_years=working_years
+        ).reshape(3, 2, working_years)
+        
+        # Weighted average across pathways (p) and sectors (s) in one contraction
+        sector_weights = np.stack([p_formal_vec, 1 - p_formal_vec], axis=1)
+        total_wages = np.einsum(
+            "p,ps,pst->t",
+            pathway_weights.astype(pathway_wages.dtype),
+            sector_weights.astype(pathway_wages.dtype),
+            pathway_wages
         )
-        govt_wages = p_formal_govt * govt_formal + (1 - p_formal_govt) * govt_informal
-        total_wages += self.counterfactual.p_government_school * govt_wages
-        
-        # Low-fee private pathway (national average: 0.15, region-adjusted)
-        p_formal_lfp = self.wage_model.regional.adjust_p_formal_control(
-            region, self.counterfactual.p_formal_low_fee_private
-        )
-        lfp_formal = self.wage_model.generate_wage_trajectory(
-            years_schooling=11,  # Partial HS
-            sector=Sector.FORMAL,
-            gender=gender,
-            location=location,
-            region=region,
-            working_years=working_years
-        )
-        lfp_informal = self.wage_model.generate_wage_trajectory(
-            years_schooling=11,
-            sector=Sector.INFORMAL,
-            gender=gender,
-            location=location,
-            region=region,
-            working_years=working_years
-        )
-        lfp_wages = p_formal_lfp * lfp_formal + (1 - p_formal_lfp) * lfp_informal
-        total_wages += self.counterfactual.p_low_fee_private * lfp_wages
-        
-        # Dropout pathway (national average: 0.05, region-adjusted)
-        p_formal_dropout = self.wage_model.regional.adjust_p_formal_control(
-            region, self.counterfactual.p_formal_dropout
-        )
-        dropout_formal = self.wage_model.generate_wage_trajectory(
-            years_schooling=5,  # Primary only
-            sector=Sector.FORMAL,
-            gender=gender,
-            location=location,
-            region=region,
-            working_years=working_years
-        )
-        dropout_informal = self.wage_model.generate_wage_trajectory(
-            years_schooling=5,
-            sector=Sector.INFORMAL,
-            gender=gender,
-            location=location,
-            region=region,
-            working_years=working_years
-        )
-        dropout_wages = (p_formal_dropout * dropout_formal + 
-                        (1 - p_formal_dropout) * dropout_informal)
-        total_wages += self.counterfactual.p_dropout * dropout_wages
         
         # Apply unemployment
         total_wages = self.employment_model.apply_unemployment_shock(
             total_wages,
-            entry_age=int(self.params.LABOR_MARKET_ENTRY_AGE.value)
+            entry_age=self._entry_age
         )
 
         return total_wages
@@ -1305,10 +1902,10 @@ class LifetimeNPVCalculator:
         Returns:
             Array of annual wages over working life
         """
-        working_years = int(self.params.WORKING_LIFE_FORMAL.value)
+        working_years = self._working_years
 
         # Use P_FORMAL_NO_TRAINING as base, with regional adjustment
-        base_p_formal = self.params.P_FORMAL_NO_TRAINING.value  # 0.10 default
+        base_p_formal = self._ps.p_formal_no_training  # 0.10 default
         p_formal = self.wage_model.regional.adjust_p_formal_control(region, base_p_formal)
         p_formal = max(0.03, min(0.25, p_formal))  # Clamp to reasonable range
 
@@ -1338,7 +1935,7 @@ class LifetimeNPVCalculator:
         # Apply unemployment
         expected_wages = self.employment_model.apply_unemployment_shock(
             expected_wages,
-            entry_age=int(self.params.LABOR_MARKET_ENTRY_AGE.value)
+            entry_age=self._entry_age
         )
 
         return expected_wages
@@ -1362,31 +1959,52 @@ class LifetimeNPVCalculator:
         wage inflation forecasts while maintaining comparability across interventions.
         """
         if discount_rate is None:
-            discount_rate = self.params.SOCIAL_DISCOUNT_RATE.value
+            discount_rate = self._ps.social_discount_rate
         
-        npv = 0
-        for t, diff in enumerate(wage_differential):
-            npv += diff / ((1 + discount_rate) ** t)
+        discount_factors = self._get_discount(discount_rate, len(wage_differential))
         
-        return npv
+        return np.dot(wage_differential, discount_factors)
     
-    def calculate_lnpv(
+    @staticmethod
+    def calculate_npv_tensor(
+        wage_tensor: np.ndarray,
+        discount_factors: np.ndarray
+    ) -> np.ndarray:
+        """
+        Discount a (n_draws, n_demographics, T) wage tensor in one contraction.
+        
+        Args:
+            wage_tensor: Output of MincerWageModel.generate_wage_tensor() (or
+                a differential of two such tensors)
+            discount_factors: (1 + r)^-t as (T,) or (n_draws, T)
+        
+        Returns:
+            NPV array shaped (n_draws, n_demographics)
+        """
+        n_years = wage_tensor.shape[-1]
+        discount_factors = np.atleast_2d(discount_factors)[:, :n_years]
+        discount_factors = np.broadcast_to(
+            discount_factors, (wage_tensor.shape[0], n_years)
+        )
+        return np.einsum("dit,dt->di", wage_tensor, discount_factors)
+    
+    def calculate_wage_streams(
         self,
         intervention: Intervention,
         gender: Gender,
         location: Location,
-        region: Region,
-        discount_rate: float = None
-    ) -> Dict:
+        region: Region
+    ) -> Tuple[np.ndarray, np.ndarray, float]:
         """
-        Calculate complete LNPV for a single scenario.
+        Calculate treatment and control earnings streams for a single scenario.
         
         For APPRENTICESHIP: Handles Year 0 stipend period where:
         - Treatment receives stipend (Ã¢â€šÂ¹120k/year)
         - Control earns informal wage (Ã¢â€šÂ¹168k/year) 
         - This creates a negative premium in Year 0 that reduces NPV
         
-        Returns dictionary with detailed results.
+        Returns:
+            Tuple of (treatment_wages, control_wages, p_formal_treatment)
         """
         treatment_wages, p_formal_treatment = self.calculate_treatment_trajectory(
             intervention, gender, location, region
@@ -1396,7 +2014,7 @@ class LifetimeNPVCalculator:
         # - RTE: Schooling pathway distribution (govt, low-fee private, dropout)
         # - Apprenticeship: Youth without vocational training (P_FORMAL_NO_TRAINING)
         if intervention == Intervention.APPRENTICESHIP:
-            control_wages = self.calculate_apprentice_control_trajectory(
+            working_control = self.calculate_apprentice_control_trajectory(
                 gender, location, region
             )
             # Extend control trajectory to match treatment length
@@ -1407,46 +2025,404 @@ class LifetimeNPVCalculator:
                 location, gender, education_level, Sector.INFORMAL
             )
             year_0_counterfactual_annual = year_0_counterfactual_monthly * 12
-            # Prepend Year 0 to control trajectory
-            control_wages = np.concatenate([[year_0_counterfactual_annual], control_wages])
+            # Year 0 followed by the working-life trajectory, in one buffer
+            control_wages = np.empty(len(working_control) + 1,
+                                     dtype=working_control.dtype)
+            control_wages[0] = year_0_counterfactual_annual
+            control_wages[1:] = working_control
         else:  # RTE
             control_wages = self.calculate_control_trajectory(
                 gender, location, region
             )
         
+        return treatment_wages, control_wages, p_formal_treatment
+    
+    def calculate_lnpv(
+        self,
+        intervention: Intervention,
+        gender: Gender,
+        location: Location,
+        region: Region,
+        discount_rate: float = None
+    ) -> Dict:
+        """
+        Calculate complete LNPV for a single scenario.
+        
+        Earnings streams come from calculate_wage_streams() (including the
+        apprenticeship Year 0 stipend period).
+        
+        Returns dictionary with detailed results.
+        """
+        treatment_wages, control_wages, p_formal_treatment = self.calculate_wage_streams(
+            intervention, gender, location, region
+        )
+        
         wage_differential = treatment_wages - control_wages
         
         lnpv = self.calculate_npv(wage_differential, discount_rate)
         
         return {
-            'intervention': intervention.value,
-            'region': region.value,
-            'gender': gender.value,
-            'location': location.value,
+            'intervention': intervention.label,
+            'region': region.label,
+            'gender': gender.label,
+            'location': location.label,
             'lnpv': lnpv,
             'treatment_lifetime_earnings': treatment_wages.sum(),
             'control_lifetime_earnings': control_wages.sum(),
             'p_formal_treatment': p_formal_treatment,
             'annual_differential': wage_differential,
-            'discount_rate': discount_rate or self.params.SOCIAL_DISCOUNT_RATE.value
+            'discount_rate': discount_rate or self._ps.social_discount_rate
         }
     
+    def calculate_wage_stream_tensors(
+        self,
+        intervention: Intervention,
+        demographics: List[Tuple[Gender, Location, Region]]
+    ) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """
+        Batched calculate_wage_streams() over many demographic cells.
+        
+        Every pathway trajectory is produced for all demographics at once by
+        MincerWageModel.generate_wage_tensor(); sector mixing, counterfactual
+        weighting, Year 0 handling and unemployment are then applied along
+        the demographic axis.
+        
+        Returns:
+            Tuple of (treatment_wages, control_wages, p_formal_treatment),
+            shaped (n_demo, T), (n_demo, T) and (n_demo,)
+        """
+        treatment_wages, control_wages, p_formal = self._wage_stream_tensors(
+            intervention, demographics
+        )
+        return treatment_wages[0], control_wages[0], p_formal[0]
+    
+    def _wage_stream_tensors(
+        self,
+        intervention: Intervention,
+        demographics: List[Tuple[Gender, Location, Region]],
+        params_batch: Dict[str, np.ndarray] = None,
+        experience_factors: np.ndarray = None,
+        discount_factors: np.ndarray = None
+    ) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """
+        Treatment/control streams over (draws, demographics, years).
+        
+        params_batch maps registry names to per-draw (n_draws,) arrays and
+        overrides the registry for those parameters; every other value is
+        read from self.params (or the wage model's registry for Mincer
+        returns and wage growth, as in the scalar path).
+        
+        If discount_factors is given the streams come back already
+        discounted: (1 + r)^-t is folded into the experience profile, so
+        it rides along with the wage tensor product instead of costing a
+        separate pass. Sector mixing and unemployment are linear in each
+        year, so the discounted streams sum directly to NPVs.
+        
+        Args:
+            intervention: RTE or APPRENTICESHIP
+            demographics: List of (gender, location, region) tuples
+            params_batch: Optional per-draw parameter arrays
+            experience_factors: Optional (T,) or (n_draws, T) experience
+                factors; defaults to the wage model's table
+            discount_factors: Optional (T,) or (n_draws, >=T) table of
+                (1 + r)^-t, indexed from Year 0 of the returned streams
+        
+        Returns:
+            Tuple of (treatment_wages, control_wages, p_formal_treatment),
+            shaped (n_draws, n_demo, T), (n_draws, n_demo, T) and
+            (n_draws, n_demo); n_draws is 1 when nothing varies by draw
+        """
+        params_batch = params_batch or {}
+        regional = self.wage_model.regional
+        region_idx = np.array([region for _, _, region in demographics])
+        working_years = self._working_years
+        entry_age = self._entry_age
+        
+        def param(name):
+            """Per-draw array if sampled, else the registry value."""
+            if name in params_batch:
+                return params_batch[name]
+            return getattr(self.params, name).value
+        
+        def wage_param(name):
+            """Like param(), but None defers to the wage model's registry."""
+            return params_batch.get(name)
+        
+        def draw_col(values):
+            """Scalar or (n_draws,) values as an (n_draws, 1) column."""
+            return np.reshape(np.asarray(values, dtype=float), (-1, 1))
+        
+        if experience_factors is None:
+            experience_factors = self.wage_model.experience_factors
+        if experience_factors is not None and np.shape(experience_factors)[-1] < working_years:
+            experience_factors = None
+        
+        # Apprenticeship streams start with the Year 0 stipend period, so the
+        # working years are discounted from t=1
+        year_0_discount = 1.0
+        if discount_factors is not None:
+            if experience_factors is None:
+                experience_factors = self.wage_model._get_experience_factors(working_years)
+            discount_factors = np.atleast_2d(discount_factors)
+            offset = 1 if intervention == Intervention.APPRENTICESHIP else 0
+            experience_factors = (
+                np.atleast_2d(experience_factors)[:, :working_years] *
+                discount_factors[:, offset:offset + working_years]
+            )
+            year_0_discount = discount_factors[:, :1]
+        
+        def wage_tensor(years_schooling, sector, **kwargs):
+            if sector == Sector.FORMAL:
+                real_wage_growth = wage_param('REAL_WAGE_GROWTH_FORMAL')
+            else:
+                real_wage_growth = wage_param('REAL_WAGE_GROWTH_INFORMAL')
+            return self.wage_model.generate_wage_tensor(
+                years_schooling, sector, demographics,
+                mincer_return=wage_param('MINCER_RETURN_HS'),
+                real_wage_growth=real_wage_growth,
+                experience_factors=experience_factors,
+                working_years=working_years, **kwargs
+            )
+        
+        def sector_mix(p_formal, formal_wages, informal_wages):
+            p_formal = p_formal[..., None].astype(formal_wages.dtype)
+            return p_formal * formal_wages + (1 - p_formal) * informal_wages
+        
+        if intervention == Intervention.RTE:
+            # Treatment: P_FORMAL_RTE scaled by regional P(Formal|HS), capped at 90%
+            p_formal_hs = regional.p_formal_hs_arr
+            national_avg = regional.p_formal_hs_national_avg
+            p_formal = np.minimum(
+                0.90,
+                draw_col(param('P_FORMAL_RTE')) * (p_formal_hs[region_idx] / national_avg)
+            )
+            years_schooling = 12 + (param('RTE_TEST_SCORE_GAIN') *
+                                   param('TEST_SCORE_TO_YEARS'))
+            treatment_wages = sector_mix(
+                p_formal,
+                wage_tensor(years_schooling, Sector.FORMAL),
+                wage_tensor(years_schooling, Sector.INFORMAL)
+            )
+            treatment_wages = self.employment_model.apply_unemployment_shock(
+                treatment_wages, entry_age=entry_age
+            )
+            
+            # Control: counterfactual schooling pathways, region-adjusted P(Formal)
+            control_multipliers = regional.p_formal_control_multipliers_arr[region_idx]
+            cf = self.counterfactual
+            control_wages = 0
+            for years, p_formal_national, weight in (
+                (10, cf.p_formal_government, cf.p_government_school),
+                (11, cf.p_formal_low_fee_private, cf.p_low_fee_private),
+                (5, cf.p_formal_dropout, cf.p_dropout),
+            ):
+                control_wages = control_wages + weight * sector_mix(
+                    draw_col(p_formal_national * control_multipliers).T,
+                    wage_tensor(years, Sector.FORMAL),
+                    wage_tensor(years, Sector.INFORMAL)
+                )
+            control_wages = self.employment_model.apply_unemployment_shock(
+                control_wages, entry_age=entry_age
+            )
+        
+        else:  # Apprenticeship
+            # Treatment: national placement rate, decaying premium, Year 0 stipend
+            p_formal = draw_col(param('P_FORMAL_APPRENTICE')) * np.ones(len(demographics))
+            expected_wages = sector_mix(
+                p_formal,
+                wage_tensor(
+                    12, Sector.FORMAL,
+                    initial_premium=param('APPRENTICE_INITIAL_PREMIUM') / (12 * 20000),
+                    decay_halflife=param('APPRENTICE_DECAY_HALFLIFE')
+                ),
+                wage_tensor(12, Sector.INFORMAL)
+            )
+            n_draws = max(len(p_formal), len(expected_wages))
+            treatment_wages = np.empty(
+                (n_draws, len(demographics), working_years + 1),
+                dtype=expected_wages.dtype
+            )
+            treatment_wages[..., 0] = (
+                draw_col(param('APPRENTICE_STIPEND_MONTHLY')) * 12 * year_0_discount
+            )
+            treatment_wages[..., 1:] = expected_wages
+            treatment_wages = self.employment_model.apply_unemployment_shock(
+                treatment_wages, entry_age=entry_age - 1
+            )
+            
+            # Control: no vocational training, Year 0 at the informal wage
+            p_formal_control = np.clip(
+                draw_col(param('P_FORMAL_NO_TRAINING')) *
+                regional.p_formal_control_multipliers_arr[region_idx],
+                0.03, 0.25
+            )
+            expected_control = self.employment_model.apply_unemployment_shock(
+                sector_mix(
+                    p_formal_control,
+                    wage_tensor(10, Sector.FORMAL),
+                    wage_tensor(10, Sector.INFORMAL)
+                ),
+                entry_age=entry_age
+            )
+            control_wages = np.empty(
+                expected_control.shape[:-1] + (working_years + 1,),
+                dtype=expected_control.dtype
+            )
+            control_wages[..., 0] = np.array([
+                self.wage_model.baseline_wages.get_wage(
+                    location, gender, EducationLevel.SECONDARY, Sector.INFORMAL
+                ) * 12
+                for gender, location, _ in demographics
+            ]) * year_0_discount
+            control_wages[..., 1:] = expected_control
+        
+        return treatment_wages, control_wages, p_formal
+    
+    def calculate_lnpv_vectorized(
+        self,
+        params_batch: Dict[str, np.ndarray],
+        intervention: Intervention,
+        demographics: List[Tuple[Gender, Location, Region]],
+        discount_factors: np.ndarray = None,
+        experience_factors: np.ndarray = None
+    ) -> np.ndarray:
+        """
+        LNPV for many parameter draws and demographic cells in one pass.
+        
+        Vectorized counterpart of calculate_lnpv(): wage streams for every
+        draw are built as (n_draws, n_demo, T) tensors with discounting
+        fused into the wage product, then summed over years in float64
+        (no separate differential or discounting pass).
+        
+        Args:
+            params_batch: Registry name -> (n_draws,) array of sampled values
+                (e.g. MonteCarloSimulator.presample_all())
+            intervention: RTE or APPRENTICESHIP
+            demographics: List of (gender, location, region) tuples
+            discount_factors: Optional (n_draws, >=T) table of (1 + r)^-t;
+                built from SOCIAL_DISCOUNT_RATE (sampled or registry) if None
+            experience_factors: Optional (n_draws, T) experience factors
+        
+        Returns:
+            LNPV array shaped (n_draws, n_demo)
+        """
+        if discount_factors is None:
+            n_years = self._working_years + (intervention == Intervention.APPRENTICESHIP)
+            discount_rate = params_batch.get(
+                'SOCIAL_DISCOUNT_RATE', self._ps.social_discount_rate
+            )
+            discount_factors = (1 + np.reshape(discount_rate, (-1, 1))) ** -np.arange(n_years)
+        
+        treatment_pv, control_pv, _ = self._wage_stream_tensors(
+            intervention, demographics, params_batch, experience_factors,
+            discount_factors=discount_factors
+        )
+        
+        return (treatment_pv.sum(axis=-1, dtype=np.float64) -
+                control_pv.sum(axis=-1, dtype=np.float64))
+
+    def calculate_lnpv_batch(
+        self,
+        params_batch: Dict[str, np.ndarray],
+        intervention: Intervention,
+        gender: Gender,
+        location: Location,
+        region: Region
+    ) -> List[Dict]:
+        """
+        calculate_lnpv() for several parameter sets of one demographic cell.
+
+        Each row of params_batch (e.g. one per scenario) is evaluated in a
+        single pass over (n_rows, 1, T) wage tensors.
+
+        Args:
+            params_batch: Registry name -> (n_rows,) array of values
+            intervention: RTE or APPRENTICESHIP
+            gender, location, region: Demographic cell
+
+        Returns:
+            One calculate_lnpv()-style result dict per row
+        """
+        treatment_wages, control_wages, p_formal = self._wage_stream_tensors(
+            intervention, [(gender, location, region)], params_batch
+        )
+        treatment_wages = treatment_wages[:, 0]
+        control_wages = control_wages[:, 0]
+        wage_differential = treatment_wages - control_wages
+        n_rows, n_years = wage_differential.shape
+
+        discount_rate = np.broadcast_to(
+            params_batch.get('SOCIAL_DISCOUNT_RATE',
+                             self._ps.social_discount_rate),
+            (n_rows,)
+        )
+        discount_factors = (1 + discount_rate[:, None]) ** -np.arange(n_years)
+        lnpv = np.einsum("dt,dt->d", wage_differential, discount_factors)
+        treatment_totals = treatment_wages.sum(axis=1)
+        control_totals = control_wages.sum(axis=1)
+        p_formal = np.broadcast_to(p_formal[:, 0], (n_rows,))
+
+        return [
+            {
+                'intervention': intervention.label,
+                'region': region.label,
+                'gender': gender.label,
+                'location': location.label,
+                'lnpv': lnpv[i],
+                'treatment_lifetime_earnings': treatment_totals[i],
+                'control_lifetime_earnings': control_totals[i],
+                'p_formal_treatment': float(p_formal[i]),
+                'annual_differential': wage_differential[i],
+                'discount_rate': float(discount_rate[i])
+            }
+            for i in range(n_rows)
+        ]
+
     def calculate_all_scenarios(self) -> List[Dict]:
         """
         Calculate LNPV for all 32 scenarios.
         
         2 interventions Ã— 4 regions Ã— 4 demographics = 32 scenarios
+        
+        Each intervention's 16 demographic cells are evaluated together as
+        (16, T) arrays (see calculate_wage_stream_tensors) and discounted in
+        one matrix-vector product; results are listed in the same
+        intervention / region / gender / location order as calculate_lnpv().
         """
+        demographics = [
+            (gender, location, region)
+            for region in Region
+            for gender in Gender
+            for location in Location
+        ]
+        discount_rate = self._ps.social_discount_rate
+        
         results = []
         
         for intervention in Intervention:
-            for region in Region:
-                for gender in Gender:
-                    for location in Location:
-                        result = self.calculate_lnpv(
-                            intervention, gender, location, region
-                        )
-                        results.append(result)
+            treatment_wages, control_wages, p_formal = self.calculate_wage_stream_tensors(
+                intervention, demographics
+            )
+            wage_differential = treatment_wages - control_wages
+            lnpv = wage_differential @ self._get_discount(
+                discount_rate, wage_differential.shape[1]
+            )
+            treatment_totals = treatment_wages.sum(axis=1)
+            control_totals = control_wages.sum(axis=1)
+            
+            for k, (gender, location, region) in enumerate(demographics):
+                results.append({
+                    'intervention': intervention.label,
+                    'region': region.label,
+                    'gender': gender.label,
+                    'location': location.label,
+                    'lnpv': lnpv[k],
+                    'treatment_lifetime_earnings': treatment_totals[k],
+                    'control_lifetime_earnings': control_totals[k],
+                    'p_formal_treatment': float(p_formal[k]),
+                    'annual_differential': wage_differential[k],
+                    'discount_rate': discount_rate
+                })
         
         return results
 
@@ -1455,6 +2431,91 @@ class LifetimeNPVCalculator:
 # SECTION 10: MONTE CARLO SENSITIVITY ANALYSIS
 # ====
 
+@dataclass(frozen=True, slots=True)
+class _SampledValue:
+    """Stand-in for Parameter exposing only the sampled `.value`."""
+    value: float
+
+
+@dataclass(frozen=True, slots=True)
+class ParameterView:
+    """
+    Read-only, registry-like view of one Monte Carlo draw.
+    
+    `view.NAME.value` returns arrays[NAME][index] for sampled parameters
+    and falls back to the base registry's Parameter for everything else,
+    so a view can be passed wherever a ParameterRegistry is read.
+    """
+    index: int
+    arrays: Dict[str, np.ndarray]
+    base: ParameterRegistry
+    
+    def __getattr__(self, name: str):
+        values = self.arrays.get(name)
+        if values is None:
+            return getattr(self.base, name)
+        return _SampledValue(float(values[self.index]))
+    
+    def snapshot(self) -> ParamSnapshot:
+        """This draw's values as a ParamSnapshot."""
+        return ParamSnapshot.from_params(self)
+
+
+def _simulate_draws(args: Tuple) -> np.ndarray:
+    """
+    LNPVs for a contiguous block of Monte Carlo draws.
+    
+    Top-level (picklable) so MonteCarloSimulator.run_simulation can farm
+    blocks out to worker processes; the serial path calls it on the whole
+    batch. `args` is (intervention, gender, location, region, arrays,
+    base_params, experience_factors, discount_factors, dtype, vectorized),
+    where `arrays` and the two (n_block, T) tables hold only this block's rows.
+    
+    With vectorized=True the block is evaluated in one pass by
+    LifetimeNPVCalculator.calculate_lnpv_vectorized(); otherwise one
+    calculator is re-pointed at each draw in turn (reference implementation).
+    
+    Returns:
+        (n_block,) float64 LNPVs
+    """
+    (intervention, gender, location, region, arrays, base_params,
+     experience_factors, discount_factors, dtype, vectorized) = args
+    
+    if vectorized:
+        calculator = LifetimeNPVCalculator(
+            params=base_params,
+            wage_model=MincerWageModel(base_params, dtype=dtype)
+        )
+        return calculator.calculate_lnpv_vectorized(
+            arrays, intervention, [(gender, location, region)],
+            discount_factors=discount_factors,
+            experience_factors=experience_factors
+        )[:, 0]
+    
+    # Wage differentials per draw (zero-padded past the end of shorter streams)
+    differentials = np.zeros(discount_factors.shape, dtype=dtype)
+    
+    # One calculator for the block; only its registry changes between draws
+    wage_model = MincerWageModel(base_params, dtype=dtype)
+    calculator = LifetimeNPVCalculator(params=base_params, wage_model=wage_model)
+    
+    for i in range(len(experience_factors)):
+        # Point the calculator at this draw's sampled parameters
+        sampled_params = ParameterView(i, arrays, base_params)
+        wage_model.experience_factors = experience_factors[i]
+        calculator.update_params(sampled_params)
+        
+        treatment_wages, control_wages, _ = calculator.calculate_wage_streams(
+            intervention, gender, location, region
+        )
+        wage_differential = treatment_wages - control_wages
+        differentials[i, :len(wage_differential)] = wage_differential
+    
+    # Row-wise dot product (no (n_draws, T) temporary); accumulate in float64
+    return np.einsum("it,it->i", differentials, discount_factors,
+                     dtype=np.float64)
+
+
 class MonteCarloSimulator:
     """
     Monte Carlo simulation for sensitivity analysis.
@@ -1463,9 +2524,40 @@ class MonteCarloSimulator:
     LNPV distribution to quantify model uncertainty.
     """
     
-    def __init__(self, n_simulations: int = 1000, seed: int = 42):
+    # Parameters varied by the simulation, in sampling order, with the
+    # (lower, upper) clamp applied to each draw (None = unbounded).
+    # Only Tier 1 and Tier 2 parameters are varied.
+    SAMPLED_PARAMETERS: Dict[str, Tuple[Optional[float], Optional[float]]] = {
+        # Tier 1 parameters (highest uncertainty)
+        'P_FORMAL_HIGHER_SECONDARY': (0.0, 1.0),
+        'P_FORMAL_RTE': (0.0, 1.0),  # NEW Jan 2026: RTE-specific formal entry
+        'P_FORMAL_APPRENTICE': (0.0, 1.0),
+        'P_FORMAL_NO_TRAINING': (0.0, 1.0),
+        'RTE_TEST_SCORE_GAIN': (0.0, 1.0),
+        'APPRENTICE_INITIAL_PREMIUM': (0, None),
+        'APPRENTICE_DECAY_HALFLIFE': (1, 100),
+        # Tier 2 parameters
+        'MINCER_RETURN_HS': (0.01, 0.15),
+        'SOCIAL_DISCOUNT_RATE': (0.01, 0.15),
+        'REAL_WAGE_GROWTH_FORMAL': (-0.01, 0.05),  # NEW Jan 2026: sector-specific
+        'REAL_WAGE_GROWTH_INFORMAL': (-0.02, 0.02),
+        'REAL_WAGE_GROWTH': (-0.005, 0.01),  # DEPRECATED but kept for backward compat
+        'FORMAL_MULTIPLIER': (1.0, 3.0),
+    }
+    
+    def __init__(self, n_simulations: int = 1000, seed: int = 42,
+                 dtype: type = np.float32):
         self.n_simulations = n_simulations
         self.seed = seed
+        # Dedicated generator (the global NumPy RNG is never touched);
+        # run_simulation() re-creates it from `seed` so every scenario sees
+        # the same draws (common random numbers)
+        self.rng = np.random.default_rng(seed)
+        # Working precision for the (n_draws, T) trajectory/discount matrices.
+        # float32 (~7 significant digits) is ample for the reduction step
+        # (per-draw LNPVs within ~1e-6 relative of a float64 run);
+        # aggregated LNPVs are always accumulated and reported in float64.
+        self.dtype = dtype
     
     def sample_parameters(self, base_params: ParameterRegistry,
                          distribution: str = "triangular") -> ParameterRegistry:
@@ -1477,124 +2569,286 @@ class MonteCarloSimulator:
         - Added REAL_WAGE_GROWTH_FORMAL and REAL_WAGE_GROWTH_INFORMAL
         - Previous: P_FORMAL_NO_TRAINING and REAL_WAGE_GROWTH added
 
-        Only Tier 1 and Tier 2 parameters are varied.
+        Only Tier 1 and Tier 2 parameters are varied (SAMPLED_PARAMETERS).
         Tier 3 (baseline wages, working life) are held constant.
         """
         sampled = ParameterRegistry()
-
-        # Helper function for clamped sampling
-        def sample_clamped(param, min_val=None, max_val=None):
-            val = param.sample(distribution)
+        base_map = base_params._param_map
+        sampled_map = sampled._param_map
+        
+        for name, (min_val, max_val) in self.SAMPLED_PARAMETERS.items():
+            val = base_map[name].sample(distribution, rng=self.rng)
             if min_val is not None:
                 val = max(min_val, val)
             if max_val is not None:
                 val = min(max_val, val)
-            return val
-
-        # Sample Tier 1 parameters (highest uncertainty) with explicit clamping
-        sampled.P_FORMAL_HIGHER_SECONDARY.value = sample_clamped(
-            base_params.P_FORMAL_HIGHER_SECONDARY, 0.0, 1.0
-        )
-        # NEW Jan 2026: RTE-specific formal entry probability
-        sampled.P_FORMAL_RTE.value = sample_clamped(
-            base_params.P_FORMAL_RTE, 0.0, 1.0
-        )
-        sampled.P_FORMAL_APPRENTICE.value = sample_clamped(
-            base_params.P_FORMAL_APPRENTICE, 0.0, 1.0
-        )
-        sampled.P_FORMAL_NO_TRAINING.value = sample_clamped(
-            base_params.P_FORMAL_NO_TRAINING, 0.0, 1.0
-        )
-        sampled.RTE_TEST_SCORE_GAIN.value = sample_clamped(
-            base_params.RTE_TEST_SCORE_GAIN, 0.0, 1.0
-        )
-        sampled.APPRENTICE_INITIAL_PREMIUM.value = sample_clamped(
-            base_params.APPRENTICE_INITIAL_PREMIUM, 0, None
-        )
-        sampled.APPRENTICE_DECAY_HALFLIFE.value = sample_clamped(
-            base_params.APPRENTICE_DECAY_HALFLIFE, 1, 100
-        )
-
-        # Sample Tier 2 parameters
-        sampled.MINCER_RETURN_HS.value = sample_clamped(
-            base_params.MINCER_RETURN_HS, 0.01, 0.15
-        )
-        sampled.SOCIAL_DISCOUNT_RATE.value = sample_clamped(
-            base_params.SOCIAL_DISCOUNT_RATE, 0.01, 0.15
-        )
-        # NEW Jan 2026: Sector-specific wage growth
-        sampled.REAL_WAGE_GROWTH_FORMAL.value = sample_clamped(
-            base_params.REAL_WAGE_GROWTH_FORMAL, -0.01, 0.05
-        )
-        sampled.REAL_WAGE_GROWTH_INFORMAL.value = sample_clamped(
-            base_params.REAL_WAGE_GROWTH_INFORMAL, -0.02, 0.02
-        )
-        # DEPRECATED but kept for backward compat
-        sampled.REAL_WAGE_GROWTH.value = sample_clamped(
-            base_params.REAL_WAGE_GROWTH, -0.005, 0.01
-        )
-        sampled.FORMAL_MULTIPLIER.value = sample_clamped(
-            base_params.FORMAL_MULTIPLIER, 1.0, 3.0
-        )
-
+            sampled_map[name].value = val
+        
         return sampled
     
+    def sample_parameters_batch(self, n: int, base_params: ParameterRegistry,
+                                distribution: str = "triangular") -> np.ndarray:
+        """
+        Draw n values of every sampled parameter from self.rng.
+        
+        Uniform and triangular draws for all parameters come from a single
+        broadcast Generator call; other distributions are drawn one
+        parameter at a time. Draws are clamped to SAMPLED_PARAMETERS bounds.
+        
+        Returns:
+            (n_params, n) float64 array, rows in SAMPLED_PARAMETERS order
+        """
+        params = [base_params._param_map[name] for name in self.SAMPLED_PARAMETERS]
+        min_vals = np.array([[p.min_val] for p in params])
+        max_vals = np.array([[p.max_val] for p in params])
+        shape = (len(params), n)
+        
+        if distribution == "triangular":
+            values = np.array([[p.value] for p in params])
+            draws = self.rng.triangular(min_vals, values, max_vals, size=shape)
+        elif distribution == "uniform":
+            draws = self.rng.uniform(min_vals, max_vals, size=shape)
+        else:
+            draws = np.empty(shape)
+            for row, p in zip(draws, params):
+                row[:] = p.sample(distribution, size=n, rng=self.rng)
+        
+        bounds = np.array(list(self.SAMPLED_PARAMETERS.values()), dtype=float)
+        lower = np.nan_to_num(bounds[:, :1], nan=-np.inf)
+        upper = np.nan_to_num(bounds[:, 1:], nan=np.inf)
+        return np.clip(draws, lower, upper, out=draws)
+    
+    def presample_all(self, n: int, base_params: ParameterRegistry,
+                      distribution: str = "triangular") -> Dict[str, np.ndarray]:
+        """
+        Draw n values of every sampled parameter (structure of arrays).
+        
+        One batched RNG call (sample_parameters_batch) replaces n scalar
+        .sample() calls per parameter, and no per-draw ParameterRegistry
+        is built.
+        
+        Returns:
+            Dict mapping parameter name -> clamped float64 array of length n
+        """
+        draws = self.sample_parameters_batch(n, base_params, distribution)
+        return dict(zip(self.SAMPLED_PARAMETERS, draws))
+    
+    def sample_batch(self, base_params: ParameterRegistry,
+                     distribution: str = "triangular") -> List[ParameterView]:
+        """
+        Draw all n_simulations parameter sets up front.
+        
+        Drawing the whole batch before evaluating any scenario lets the
+        per-draw lookup tables (see build_draw_tables) be computed once per run.
+        Draws are returned as ParameterViews over presample_all() arrays.
+        """
+        arrays = self.presample_all(self.n_simulations, base_params, distribution)
+        return [ParameterView(i, arrays, base_params)
+                for i in range(self.n_simulations)]
+    
+    @staticmethod
+    def build_draw_tables(
+        discount_rate: Union[float, np.ndarray],
+        experience_linear: Union[float, np.ndarray],
+        experience_quad: Union[float, np.ndarray],
+        n_draws: int,
+        n_years: int,
+        dtype: type = np.float64
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Precompute discount and experience factors for every draw.
+        
+        Each rate is either a per-draw array of length n_draws or a scalar
+        held constant across draws.
+        
+        Returns:
+            Tuple of (discount_factors, experience_factors), both shaped
+            (n_draws, n_years):
+            - discount_factors[i, t] = (1 + r_i)^-t
+            - experience_factors[i, t] = exp(b1_i*t + b2_i*t^2)
+        
+        Both depend only on the draw, so they are shared by every
+        demographic cell evaluated with that draw.
+        """
+        r = np.asarray(discount_rate, dtype=dtype)[..., None]
+        b1 = np.asarray(experience_linear, dtype=dtype)[..., None]
+        b2 = np.asarray(experience_quad, dtype=dtype)[..., None]
+        
+        t = np.arange(n_years, dtype=dtype)
+        shape = (n_draws, n_years)
+        discount_factors = np.broadcast_to((1 + r) ** (-t), shape)
+        experience_factors = np.broadcast_to(np.exp(b1 * t + b2 * t * t), shape)
+        
+        return discount_factors, experience_factors
+    
     def run_simulation(
         self,
         intervention: Intervention,
         gender: Gender,
         location: Location,
         region: Region,
-        base_params: ParameterRegistry = None
+        base_params: ParameterRegistry = None,
+        n_jobs: int = 1,
+        vectorized: bool = True
     ) -> Dict:
         """
         Run Monte Carlo simulation for single scenario.
         
+        By default all draws are evaluated together as (n_draws, T) arrays
+        (LifetimeNPVCalculator.calculate_lnpv_vectorized); vectorized=False
+        falls back to building a calculator per draw, which gives the same
+        LNPVs to floating-point rounding.
+        
+        Draws are independent, so with n_jobs > 1 (or -1 for all cores) they
+        are split into contiguous blocks evaluated in a process pool.
+        Sampling happens up front in the parent, so results are identical
+        to the serial run for the same seed.
+        
         Returns distribution of LNPV estimates.
         """
-        np.random.seed(self.seed)
+        self.rng = np.random.default_rng(self.seed)
         
         if base_params is None:
-            base_params = ParameterRegistry()
-        
-        lnpv_samples = []
+            base_params = get_default_registry()
+        
+        # Sample all draws, then build the (n_draws, T) lookup tables once.
+        # T covers the 41-year apprenticeship stream (Year 0 + 40 working years).
+        arrays = self.presample_all(self.n_simulations, base_params)
+        n_years = int(base_params.WORKING_LIFE_FORMAL.value) + 1
+        discount_factors, experience_factors = self.build_draw_tables(
+            arrays['SOCIAL_DISCOUNT_RATE'],
+            base_params.EXPERIENCE_LINEAR.value,
+            base_params.EXPERIENCE_QUAD.value,
+            self.n_simulations, n_years, dtype=self.dtype
+        )
         
-        for i in range(self.n_simulations):
-            # Sample parameters
-            sampled_params = self.sample_parameters(base_params)
-            
-            # Create calculator with sampled parameters
-            calculator = LifetimeNPVCalculator(params=sampled_params)
-            
-            # Calculate LNPV
-            result = calculator.calculate_lnpv(
-                intervention, gender, location, region
-            )
-            
-            lnpv_samples.append(result['lnpv'])
+        if n_jobs == -1:
+            n_jobs = os.cpu_count() or 1
+        n_jobs = max(1, min(n_jobs, self.n_simulations))
+        
+        # LNPV per draw, one task per contiguous block of draws
+        blocks = np.array_split(np.arange(self.n_simulations), n_jobs)
+        tasks = [
+            (intervention, gender, location, region,
+             {name: values[block] for name, values in arrays.items()},
+             base_params, experience_factors[block], discount_factors[block],
+             self.dtype, vectorized)
+            for block in blocks
+        ]
+        if n_jobs == 1:
+            lnpv_array = _simulate_draws(tasks[0])
+        else:
+            with ProcessPoolExecutor(max_workers=n_jobs) as executor:
+                lnpv_array = np.concatenate(list(executor.map(_simulate_draws, tasks)))
         
-        lnpv_array = np.array(lnpv_samples)
+        # All quantiles from one partition pass (median = 50th percentile)
+        p5, p25, median, p75, p95 = np.percentile(lnpv_array, [5, 25, 50, 75, 95])
         
         return {
-            'intervention': intervention.value,
-            'region': region.value,
-            'gender': gender.value,
-            'location': location.value,
-            'mean': np.mean(lnpv_array),
-            'median': np.median(lnpv_array),
-            'std': np.std(lnpv_array),
-            'p5': np.percentile(lnpv_array, 5),
-            'p25': np.percentile(lnpv_array, 25),
-            'p75': np.percentile(lnpv_array, 75),
-            'p95': np.percentile(lnpv_array, 95),
+            'intervention': intervention.label,
+            'region': region.label,
+            'gender': gender.label,
+            'location': location.label,
+            'mean': lnpv_array.mean(),
+            'median': median,
+            'std': lnpv_array.std(),
+            'p5': p5,
+            'p25': p25,
+            'p75': p75,
+            'p95': p95,
             'samples': lnpv_array
         }
 
+    def run_simulation_all(
+        self,
+        base_params: ParameterRegistry = None
+    ) -> List[Dict]:
+        """
+        Run Monte Carlo simulation for all 32 scenarios at once.
+
+        Every (intervention, demographic) cell is evaluated on the same
+        draws as run_simulation(), so each entry matches the corresponding
+        single-scenario run; the LNPVs form one (n_draws, 32) array and all
+        summary statistics are taken along the draw axis in one pass.
+
+        Returns:
+            List of run_simulation()-style dicts in the same intervention /
+            region / gender / location order as
+            LifetimeNPVCalculator.calculate_all_scenarios()
+        """
+        self.rng = np.random.default_rng(self.seed)
+
+        if base_params is None:
+            base_params = get_default_registry()
+
+        arrays = self.presample_all(self.n_simulations, base_params)
+        n_years = int(base_params.WORKING_LIFE_FORMAL.value) + 1
+        discount_factors, experience_factors = self.build_draw_tables(
+            arrays['SOCIAL_DISCOUNT_RATE'],
+            base_params.EXPERIENCE_LINEAR.value,
+            base_params.EXPERIENCE_QUAD.value,
+            self.n_simulations, n_years, dtype=self.dtype
+        )
+
+        demographics = [
+            (gender, location, region)
+            for region in Region
+            for gender in Gender
+            for location in Location
+        ]
+        calculator = LifetimeNPVCalculator(
+            params=base_params,
+            wage_model=MincerWageModel(base_params, dtype=self.dtype)
+        )
+        cells = [
+            (intervention, gender, location, region)
+            for intervention in Intervention
+            for gender, location, region in demographics
+        ]
+
+        # LNPV per (draw, cell), shape (n_draws, 32)
+        lnpv_matrix = np.hstack([
+            calculator.calculate_lnpv_vectorized(
+                arrays, intervention, demographics,
+                discount_factors=discount_factors,
+                experience_factors=experience_factors
+            )
+            for intervention in Intervention
+        ])
+
+        p5, p25, median, p75, p95 = np.percentile(
+            lnpv_matrix, [5, 25, 50, 75, 95], axis=0
+        )
+        mean = lnpv_matrix.mean(axis=0)
+        std = lnpv_matrix.std(axis=0)
+
+        return [
+            {
+                'intervention': intervention.label,
+                'region': region.label,
+                'gender': gender.label,
+                'location': location.label,
+                'mean': mean[k],
+                'median': median[k],
+                'std': std[k],
+                'p5': p5[k],
+                'p25': p25[k],
+                'p75': p75[k],
+                'p95': p95[k],
+                'samples': lnpv_matrix[:, k]
+            }
+            for k, (intervention, gender, location, region) in enumerate(cells)
+        ]
+
 
 # ====
 # SECTION 10A: SCENARIO COMPARISON UTILITIES
 # ====
 
+# Scenario order used by run_scenario_comparison() and its batch variant
+SCENARIO_NAMES = ('conservative', 'moderate', 'optimistic')
+
+
 def run_scenario_comparison(
     intervention: Intervention,
     gender: Gender,
@@ -1638,25 +2892,45 @@ def run_scenario_comparison(
     """
     from parameter_registry_v3 import get_scenario_parameters
     
-    results = {}
-    
-    for scenario_name in ['conservative', 'moderate', 'optimistic']:
-        # Create fresh ParameterRegistry
-        params = ParameterRegistry()
-        
-        # Apply scenario overrides
-        scenario_values = get_scenario_parameters(scenario_name)
-        for param_name, value in scenario_values.items():
-            if hasattr(params, param_name):
-                getattr(params, param_name).value = value
-        
-        # Calculate LNPV with scenario parameters
-        calculator = LifetimeNPVCalculator(params=params)
-        result = calculator.calculate_lnpv(intervention, gender, location, region)
+    # Fresh registry: scenario overrides are applied as length-3 arrays
+    # rather than by mutating Parameter values
+    params = ParameterRegistry()
+    scenario_values = [get_scenario_parameters(name) for name in SCENARIO_NAMES]
+    param_map = params._param_map
+    param_names = {
+        name for values in scenario_values for name in values
+        if name in param_map
+    }
+    params_batch = {
+        name: np.array([
+            values.get(name, param_map[name].value)
+            for values in scenario_values
+        ])
+        for name in param_names
+    }
+    
+    # All three scenarios in one vectorized pass
+    calculator = LifetimeNPVCalculator(params=params)
+    results = calculator.calculate_lnpv_batch(
+        params_batch, intervention, gender, location, region
+    )
+    for scenario_name, result in zip(SCENARIO_NAMES, results):
         result['scenario'] = scenario_name
-        results[scenario_name] = result
     
-    return results
+    return dict(zip(SCENARIO_NAMES, results))
+
+
+# Interpretation notes appended by format_scenario_comparison()
+_SCENARIO_COMPARISON_NOTES = (
+    "\nNOTES:\n"
+    "- Moderate scenario uses RWF-validated 68% apprentice placement rate\n"
+    "- P(Formal|RTE) assumptions:\n"
+    "  * Conservative (25%): Marginally better than worst regions\n"
+    "  * Moderate (40%): 2Ã— national average (requires selection/urban effects)\n"
+    "  * Optimistic (60%): Near stakeholder intuition (requires strong selection)\n"
+    "- Range reflects uncertainty in Tier 1 critical parameters\n"
+    "- All scenarios use PLFS 2023-24 baseline wages and 5.8% Mincer returns\n"
+)
 
 
 def format_scenario_comparison(results: Dict[str, Dict]) -> str:
@@ -1685,55 +2959,49 @@ def format_scenario_comparison(results: Dict[str, Dict]) -> str:
         Optimistic      Rs 156.2L      90.0%             Rs 185.3L
         ================================================================================
     """
-    output = "\n" + "="*80 + "\n"
-    output += "SCENARIO COMPARISON RESULTS\n"
-    output += "="*80 + "\n\n"
-    
-    intervention = results['moderate']['intervention']
-    output += f"Intervention: {intervention.upper()}\n"
-    output += f"Demographics: {results['moderate']['gender']} / "
-    output += f"{results['moderate']['location']} / {results['moderate']['region']}\n\n"
-    
-    output += f"{'Scenario':<15} {'LNPV':>15} {'P(Formal)':>12} {'Lifetime Earnings':>20}\n"
-    output += "-"*80 + "\n"
+    moderate = results['moderate']
+    parts = [
+        "\n" + "="*80 + "\n",
+        "SCENARIO COMPARISON RESULTS\n",
+        "="*80 + "\n\n",
+        f"Intervention: {moderate['intervention'].upper()}\n",
+        f"Demographics: {moderate['gender']} / "
+        f"{moderate['location']} / {moderate['region']}\n\n",
+        f"{'Scenario':<15} {'LNPV':>15} {'P(Formal)':>12} {'Lifetime Earnings':>20}\n",
+        "-"*80 + "\n",
+    ]
     
     for scenario in ['conservative', 'moderate', 'optimistic']:
         r = results[scenario]
-        lnpv = r['lnpv']
-        p_formal = r['p_formal_treatment']
-        lifetime = r['treatment_lifetime_earnings']
-        
-        output += f"{scenario.capitalize():<15} "
-        output += f"{format_currency(lnpv):>15} "
-        output += f"{p_formal:>11.1%} "
-        output += f"{format_currency(lifetime):>20}\n"
-    
-    output += "="*80 + "\n"
+        parts.append(
+            f"{scenario.capitalize():<15} "
+            f"{format_currency(r['lnpv']):>15} "
+            f"{r['p_formal_treatment']:>11.1%} "
+            f"{format_currency(r['treatment_lifetime_earnings']):>20}\n"
+        )
     
-    # Add interpretation notes
-    output += "\nNOTES:\n"
-    output += "- Moderate scenario uses RWF-validated 68% apprentice placement rate\n"
-    output += "- P(Formal|RTE) assumptions:\n"
-    output += "  * Conservative (25%): Marginally better than worst regions\n"
-    output += "  * Moderate (40%): 2Ã— national average (requires selection/urban effects)\n"
-    output += "  * Optimistic (60%): Near stakeholder intuition (requires strong selection)\n"
-    output += "- Range reflects uncertainty in Tier 1 critical parameters\n"
-    output += "- All scenarios use PLFS 2023-24 baseline wages and 5.8% Mincer returns\n"
+    parts.append("="*80 + "\n")
+    parts.append(_SCENARIO_COMPARISON_NOTES)
     
-    return output
+    return "".join(parts)
 
 
 def run_scenario_comparison_batch(
     intervention: Intervention,
-    demographics: List[Tuple[Gender, Location, Region]] = None
+    demographics: List[Tuple[Gender, Location, Region]] = None,
+    n_jobs: int = 1
 ) -> Dict[str, Dict[str, Dict]]:
     """
     Run scenario comparison for multiple demographic groups.
     
+    Demographic groups are independent; with n_jobs > 1 (or -1 for all
+    cores) they are evaluated in a process pool.
+    
     Args:
         intervention: RTE or APPRENTICESHIP
         demographics: List of (gender, location, region) tuples
                      If None, runs for all 16 demographic combinations
+        n_jobs: Worker processes (default 1 = serial)
     
     Returns:
         Nested dict: {demographic_key: {scenario: results}}
@@ -1758,13 +3026,32 @@ def run_scenario_comparison_batch(
             for region in Region
         ]
     
-    batch_results = {}
+    if n_jobs == -1:
+        n_jobs = os.cpu_count() or 1
     
-    for gender, location, region in demographics:
-        demo_key = f"{gender.value}_{location.value}_{region.value}"
-        batch_results[demo_key] = run_scenario_comparison(
-            intervention, gender, location, region
-        )
+    if n_jobs <= 1:
+        batch_results = {}
+        
+        for gender, location, region in demographics:
+            demo_key = f"{gender.label}_{location.label}_{region.label}"
+            batch_results[demo_key] = run_scenario_comparison(
+                intervention, gender, location, region
+            )
+        
+        return batch_results
+    
+    tasks = [
+        (intervention, gender, location, region)
+        for gender, location, region in demographics
+    ]
+    with ProcessPoolExecutor(max_workers=n_jobs) as executor:
+        results = list(executor.map(run_scenario_comparison, *zip(*tasks), chunksize=4))
+    
+    # Reassemble in demographic order
+    batch_results = {}
+    for (_, gender, location, region), result in zip(tasks, results):
+        demo_key = f"{gender.label}_{location.label}_{region.label}"
+        batch_results[demo_key] = result
     
     return batch_results
 
@@ -1980,44 +3267,58 @@ def demonstrate_npv_conversion():
     print("="*70)
 
 
-def print_scenario_results(results: List[Dict]):
-    """Print formatted results for all scenarios."""
+def print_scenario_results(results) -> None:
+    """
+    Print formatted results for all scenarios.
+    
+    Args:
+        results: DataFrame from run_baseline_analysis() or the list of dicts
+            returned by LifetimeNPVCalculator.calculate_all_scenarios()
+    """
+    import pandas as pd
+    
+    table = pd.DataFrame(results)[
+        ['intervention', 'region', 'gender', 'location', 'lnpv']
+    ]
+    table.columns = ['Intervention', 'Region', 'Gender', 'Location', 'LNPV']
+    
     print("\n" + "="*80)
     print("RWF ECONOMIC IMPACT MODEL - LNPV RESULTS")
     print("="*80)
-    print(f"{'Intervention':<15} {'Region':<8} {'Gender':<8} {'Location':<8} {'LNPV':>15}")
-    print("-"*80)
-    
-    for r in results:
-        print(f"{r['intervention']:<15} {r['region']:<8} {r['gender']:<8} "
-              f"{r['location']:<8} {format_currency(r['lnpv']):>15}")
-    
+    print(table.to_string(index=False, formatters={'LNPV': format_currency}))
     print("="*80)
 
 
-def run_baseline_analysis() -> List[Dict]:
+def run_baseline_analysis() -> "pandas.DataFrame":
     """
     Run baseline LNPV analysis for all 32 scenarios.
     
     This is the main entry point for generating results.
+    
+    Returns:
+        DataFrame with one row per scenario and the calculate_lnpv() result
+        fields as columns (intervention, region, gender, location, lnpv,
+        p_formal_treatment, ...)
     """
+    import pandas as pd
+    
     print("\nInitializing RWF Economic Impact Model v4.1...")
     print("Using PLFS 2023-24 parameters (Milestone 2 update)")
     print("Gap Analysis fixes applied (Sections 4.1-4.4)")
     print("-"*50)
     
     calculator = LifetimeNPVCalculator()
-    results = calculator.calculate_all_scenarios()
+    results = pd.DataFrame(calculator.calculate_all_scenarios())
     
     print_scenario_results(results)
     
-    # Summary statistics
-    lnpv_values = [r['lnpv'] for r in results]
+    # Summary statistics as column reductions
+    lnpv_values = results['lnpv'].to_numpy()
     print(f"\nSummary Statistics:")
-    print(f"  Mean LNPV: {format_currency(np.mean(lnpv_values))}")
+    print(f"  Mean LNPV: {format_currency(lnpv_values.mean())}")
     print(f"  Median LNPV: {format_currency(np.median(lnpv_values))}")
-    print(f"  Min LNPV: {format_currency(np.min(lnpv_values))}")
-    print(f"  Max LNPV: {format_currency(np.max(lnpv_values))}")
+    print(f"  Min LNPV: {format_currency(lnpv_values.min())}")
+    print(f"  Max LNPV: {format_currency(lnpv_values.max())}")
     
     return results
 
@@ -2030,7 +3331,7 @@ def run_sensitivity_analysis(
     Run Monte Carlo sensitivity analysis.
     """
     print(f"\nRunning Monte Carlo sensitivity analysis...")
-    print(f"Intervention: {intervention.value}")
+    print(f"Intervention: {intervention.label}")
     print(f"Simulations: {n_simulations}")
     print("-"*50)
     
@@ -2044,7 +3345,7 @@ def run_sensitivity_analysis(
         region=Region.WEST
     )
     
-    print(f"\nMonte Carlo Results ({intervention.value}, Urban Male, West):")
+    print(f"\nMonte Carlo Results ({intervention.label}, Urban Male, West):")
     print(f"  Mean LNPV: {format_currency(results['mean'])}")
     print(f"  Median LNPV: {format_currency(results['median'])}")
     print(f"  Std Dev: {format_currency(results['std'])}")
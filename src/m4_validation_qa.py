@@ -19,14 +19,25 @@ Author: RWF Economic Impact Analysis Team
 Date: January 2026
 """
 
+import csv
+import functools
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
 import numpy as np
 import pandas as pd
-import matplotlib.pyplot as plt
 import os
 import sys
 from pathlib import Path
 from datetime import datetime
 
+# Optional: pyarrow's CSV writer is much faster than DataFrame.to_csv;
+# _write_csv falls back to pandas when it is not installed
+try:
+    import pyarrow as pa
+    import pyarrow.csv as pacsv
+    PYARROW_AVAILABLE = True
+except ImportError:
+    PYARROW_AVAILABLE = False
+
 # Add model directory to path
 model_dir = Path(__file__).parent
 sys.path.insert(0, str(model_dir))
@@ -36,11 +47,12 @@ from economic_core_v4 import (
     RegionalParameters, Gender, Location, Region, Intervention, Sector,
     EducationLevel, DecayFunction, format_currency
 )
+from econ_kernels import NUMBA_AVAILABLE, _decay_kernel
 from parameter_registry_v3 import (
     MINCER_RETURN_HS, EXPERIENCE_LINEAR, EXPERIENCE_QUAD,
     REAL_WAGE_GROWTH_FORMAL, REAL_WAGE_GROWTH_INFORMAL,
     P_FORMAL_RTE, P_FORMAL_HIGHER_SECONDARY, P_FORMAL_APPRENTICE,
-    APPRENTICE_DECAY_HALFLIFE, SCENARIO_CONFIGS
+    APPRENTICE_DECAY_HALFLIFE, SCENARIO_CONFIGS, VERSION
 )
 
 # Output directory
@@ -55,6 +67,136 @@ VALIDATION_RESULTS = {
     'timestamp': []
 }
 
+# Column types for the model output CSVs, keyed by normalized column name
+# (see _normalize_column). Only these columns are parsed; types are given
+# up front instead of being inferred.
+LNPV_DTYPES = {
+    'intervention': 'category', 'gender': 'category',
+    'location': 'category', 'region': 'category',
+    'lnpv': 'float64', 'lnpv_lakhs': 'float64',
+}
+BREAKEVEN_DTYPES = {
+    'scenario_id': 'object', 'intervention': 'category', 'gender': 'category',
+    'location': 'category', 'region': 'category',
+    'lnpv': 'float64', 'lnpv_lakhs': 'float64',
+    'max_cost_bcr_3_lakhs': 'float64', 'max_cost_bcr_3': 'float64',
+}
+TORNADO_DTYPES = {'parameter_name': 'object', 'rank': 'int64'}
+MC_DTYPES = {'scenario_id': 'object', 'median': 'float64'}
+SCENARIO_DTYPES = {'scenario': 'object', 'lnpv_lakhs': 'float64'}
+DECOMPOSITION_DTYPES = {
+    'placement_effect': 'float64', 'mincer_effect': 'float64',
+    'total_effect': 'float64', 'placement_share_pct': 'float64',
+}
+
+_CSV_SCHEMAS = {
+    'lnpv': LNPV_DTYPES,
+    'breakeven': BREAKEVEN_DTYPES,
+    'tornado': TORNADO_DTYPES,
+    'monte_carlo': MC_DTYPES,
+    'scenarios': SCENARIO_DTYPES,
+    'decomposition': DECOMPOSITION_DTYPES,
+}
+
+
+def _normalize_column(name: str) -> str:
+    """'LNPV (₹ Lakhs)' -> 'lnpv_lakhs', 'Intervention' -> 'intervention'."""
+    return (name.lower().replace(' ', '_').replace('(', '')
+            .replace(')', '').replace('₹_', ''))
+
+
+@functools.lru_cache(maxsize=None)
+def _load_csv(path: str, schema: str = None, all_columns: bool = False) -> pd.DataFrame:
+    """
+    Parse a model output CSV once per run; later checks reuse the frame.
+
+    With a schema name from _CSV_SCHEMAS, only that schema's columns are
+    read (all of them if all_columns, for frames written back out) with
+    their declared dtypes.
+
+    Intervention labels are lower-cased here ('RTE' -> 'rte') so checks
+    compare against the lower-case categories directly.
+
+    The cached DataFrame is shared, so callers that add or rename columns
+    must work on a .copy().
+    """
+    if schema is None:
+        return pd.read_csv(path)
+    dtypes = _CSV_SCHEMAS[schema]
+    usecols = None if all_columns else (lambda c: _normalize_column(c) in dtypes)
+    df = pd.read_csv(path, usecols=usecols, dtype=dtypes)
+    for col in df.columns:
+        if _normalize_column(col) == 'intervention':
+            df[col] = df[col].str.lower().astype('category')
+    return df
+
+
+# CSVs read by the checks, as (path under outputs/, schema, extra kwargs):
+# called exactly as the checks call _load_csv, so prefetching fills the
+# same lru_cache entries
+_PREFETCH_CSVS = [
+    (("lnpv_results_v4.csv",), 'lnpv', {}),
+    (("lnpv_results_v4.csv",), 'lnpv', {'all_columns': True}),
+    (("sensitivity", "breakeven", "breakeven_analysis_32scenarios.csv"), 'breakeven', {}),
+    (("sensitivity", "scenarios", "scenario_bounds.csv"), 'scenarios', {}),
+    (("sensitivity", "monte_carlo", "monte_carlo_distributions.csv"), 'monte_carlo', {}),
+    (("sensitivity_tornado_rte.csv",), 'tornado', {}),
+    (("sensitivity_tornado_apprenticeship.csv",), 'tornado', {}),
+    (("sensitivity", "decomposition", "decomposition_analysis.csv"), 'decomposition',
+     {'all_columns': True}),
+]
+
+
+def _prefetch_csvs(max_workers: int = 4):
+    """
+    Read the existing check input CSVs concurrently into the _load_csv
+    cache. The C parser releases the GIL, so threads overlap the reads.
+    """
+    outputs_dir = model_dir / "outputs"
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        for parts, schema, kwargs in _PREFETCH_CSVS:
+            path = outputs_dir.joinpath(*parts)
+            if path.exists():
+                executor.submit(_load_csv, str(path), schema, **kwargs)
+
+
+def _ensure_lnpv_lakhs(df: pd.DataFrame) -> pd.DataFrame:
+    """
+    Return df with LNPV in ₹ lakhs under the canonical 'lnpv_lakhs' name,
+    renaming 'LNPV (₹ Lakhs)' or deriving it from 'lnpv' (₹) as needed.
+
+    Never modifies df in place, so it is safe on frames cached by _load_csv.
+    """
+    if 'lnpv_lakhs' in df.columns:
+        return df
+    if 'LNPV (₹ Lakhs)' in df.columns:
+        return df.rename(columns={'LNPV (₹ Lakhs)': 'lnpv_lakhs'})
+    if 'lnpv' in df.columns:
+        return df.assign(lnpv_lakhs=df['lnpv'].to_numpy() / 100000.0)
+    return df
+
+
+def _write_csv(df: pd.DataFrame, path):
+    """Write df to path as CSV without the index (pyarrow if available)."""
+    if PYARROW_AVAILABLE:
+        pacsv.write_csv(pa.Table.from_pandas(df, preserve_index=False), str(path))
+    else:
+        df.to_csv(path, index=False)
+
+
+def _pyplot():
+    """
+    Import matplotlib.pyplot on first use (plots are only drawn by checks 1
+    and 5). Selects the non-interactive Agg backend unless pyplot was
+    already imported by the caller, e.g. inside a notebook.
+    """
+    if 'matplotlib.pyplot' not in sys.modules:
+        import matplotlib
+        matplotlib.use('Agg')
+    import matplotlib.pyplot as plt
+    return plt
+
+
 def log_result(check_name: str, passed: bool, details: str):
     """Log validation result."""
     status = "✅ PASS" if passed else "❌ FAIL"
@@ -112,12 +254,13 @@ def check_age_wage_profiles():
         working_years=working_years
     )
 
-    # Calculate annual growth rates
-    formal_growth_rates = np.diff(formal_wages) / formal_wages[:-1]
-    informal_growth_rates = np.diff(informal_wages) / informal_wages[:-1]
+    # Calculate annual growth rates as log differences (log-growth, equal to
+    # the simple rate to within g^2/2 for rates of a few percent)
+    formal_growth_rates = np.diff(np.log(formal_wages))
+    informal_growth_rates = np.diff(np.log(informal_wages))
 
-    avg_formal_growth = np.mean(formal_growth_rates) * 100
-    avg_informal_growth = np.mean(informal_growth_rates) * 100
+    avg_formal_growth = formal_growth_rates.mean() * 100
+    avg_informal_growth = informal_growth_rates.mean() * 100
 
     # Find peak earnings age
     formal_peak_year = np.argmax(formal_wages)
@@ -158,6 +301,7 @@ def check_age_wage_profiles():
     criteria.append(("Formal > Informal always", formal_always_higher, f"Ratio at year 0: {formal_wages[0]/informal_wages[0]:.2f}x"))
 
     # Plot and save
+    plt = _pyplot()
     fig, axes = plt.subplots(1, 2, figsize=(14, 5))
 
     ages = np.arange(22, 22 + working_years)
@@ -222,29 +366,26 @@ def check_npv_magnitude():
     # Read existing results
     results_path = model_dir / "outputs" / "lnpv_results_v4.csv"
     if results_path.exists():
-        df = pd.read_csv(results_path)
+        # All columns: df is written back out as the distribution check below
+        df = _load_csv(str(results_path), 'lnpv', all_columns=True)
     else:
         # Calculate fresh
         calculator = LifetimeNPVCalculator()
         results = calculator.calculate_all_scenarios()
-        df = pd.DataFrame(results)
-        df['LNPV (₹ Lakhs)'] = df['lnpv'] / 100000
+        df = _ensure_lnpv_lakhs(pd.DataFrame(results))
 
-    # Extract LNPV values (convert from lakhs if needed)
-    if 'LNPV (₹ Lakhs)' in df.columns:
-        lnpv_lakhs = df['LNPV (₹ Lakhs)']
-    elif 'lnpv' in df.columns:
-        lnpv_lakhs = df['lnpv'] / 100000
-    else:
+    # Extract LNPV values in lakhs (df itself is written out unchanged below)
+    lnpv_df = _ensure_lnpv_lakhs(df)
+    if 'lnpv_lakhs' not in lnpv_df.columns:
         print("  ❌ Could not find LNPV column")
         return False, []
+    lnpv_lakhs = lnpv_df['lnpv_lakhs']
 
     # Separate by intervention
-    rte_df = df[df['Intervention'].str.upper() == 'RTE'] if 'Intervention' in df.columns else df[df['intervention'] == 'rte']
-    app_df = df[df['Intervention'].str.upper() == 'APPRENTICESHIP'] if 'Intervention' in df.columns else df[df['intervention'] == 'apprenticeship']
-
-    rte_lnpv = rte_df['LNPV (₹ Lakhs)'] if 'LNPV (₹ Lakhs)' in rte_df.columns else rte_df['lnpv'] / 100000
-    app_lnpv = app_df['LNPV (₹ Lakhs)'] if 'LNPV (₹ Lakhs)' in app_df.columns else app_df['lnpv'] / 100000
+    # (intervention labels are lower-cased by _load_csv)
+    intervention_col = 'Intervention' if 'Intervention' in df.columns else 'intervention'
+    rte_lnpv = lnpv_lakhs[df[intervention_col] == 'rte']
+    app_lnpv = lnpv_lakhs[df[intervention_col] == 'apprenticeship']
 
     # Validation criteria
     criteria = []
@@ -270,18 +411,20 @@ def check_npv_magnitude():
     criteria.append(("Apprenticeship avg > RTE avg", app_gt_rte,
                     f"App: ₹{app_lnpv.mean():.1f}L vs RTE: ₹{rte_lnpv.mean():.1f}L"))
 
-    # 5. No outliers (> 3 SD from median)
-    all_lnpv = lnpv_lakhs.values
+    # 5. No outliers (> 3 robust SD from median; robust SD = 1.4826 x MAD)
+    all_lnpv = lnpv_lakhs.to_numpy()
     median_lnpv = np.median(all_lnpv)
-    std_lnpv = np.std(all_lnpv)
-    outliers = np.abs(all_lnpv - median_lnpv) > 3 * std_lnpv
+    abs_dev = np.abs(all_lnpv - median_lnpv)
+    robust_sd = 1.4826 * np.median(abs_dev)
+    # MAD of 0 (over half the results identical) would flag every other value
+    outliers = abs_dev > 3 * robust_sd if robust_sd > 0 else np.zeros(len(all_lnpv), dtype=bool)
     no_outliers = not outliers.any()
-    criteria.append(("No outliers (>3 SD)", no_outliers, f"Median: ₹{median_lnpv:.1f}L, SD: ₹{std_lnpv:.1f}L"))
+    criteria.append(("No outliers (>3 robust SD)", no_outliers,
+                    f"Median: ₹{median_lnpv:.1f}L, robust SD (MAD): ₹{robust_sd:.1f}L"))
 
-    # Save validation CSV
-    validation_df = df.copy()
-    validation_df['within_range'] = True  # Would flag issues here
-    validation_df.to_csv(OUTPUT_DIR / 'validation_lnpv_distribution_check.csv', index=False)
+    # Save validation CSV (assign adds the flag without a deep copy of df)
+    _write_csv(df.assign(within_range=True),  # Would flag issues here
+               OUTPUT_DIR / 'validation_lnpv_distribution_check.csv')
 
     # Overall pass/fail
     all_passed = all(c[1] for c in criteria)
@@ -315,25 +458,16 @@ def check_breakeven_costs():
         print("  ⚠️ Break-even file not found, calculating from LNPV")
         # Calculate from LNPV
         lnpv_path = model_dir / "outputs" / "lnpv_results_v4.csv"
-        df = pd.read_csv(lnpv_path)
-        # Handle different column naming conventions
-        if 'LNPV (₹ Lakhs)' in df.columns:
-            df['max_cost_bcr_3_lakhs'] = df['LNPV (₹ Lakhs)'] / 3
-            df['max_cost_bcr_1_lakhs'] = df['LNPV (₹ Lakhs)']
-        elif 'lnpv' in df.columns:
-            df['max_cost_bcr_3_lakhs'] = df['lnpv'] / 300000
-            df['max_cost_bcr_1_lakhs'] = df['lnpv'] / 100000
+        df = _load_csv(str(lnpv_path), 'lnpv')
     else:
-        df = pd.read_csv(breakeven_path)
+        df = _load_csv(str(breakeven_path), 'breakeven')
 
     # Get BCR=3 thresholds
     bcr3_col = 'max_cost_bcr_3_lakhs' if 'max_cost_bcr_3_lakhs' in df.columns else 'max_cost_bcr_3'
     if bcr3_col not in df.columns:
-        # Calculate from lnpv
-        if 'lnpv_lakhs' in df.columns:
-            df['max_cost_bcr_3_lakhs'] = df['lnpv_lakhs'] / 3
-        elif 'lnpv' in df.columns:
-            df['max_cost_bcr_3_lakhs'] = df['lnpv'] / 300000
+        # Calculate from lnpv: break-even cost at BCR=3 is LNPV / 3
+        df = _ensure_lnpv_lakhs(df)
+        df = df.assign(max_cost_bcr_3_lakhs=df['lnpv_lakhs'].to_numpy() * (1.0 / 3.0))
         bcr3_col = 'max_cost_bcr_3_lakhs'
 
     breakeven_costs = df[bcr3_col]
@@ -347,32 +481,42 @@ def check_breakeven_costs():
     criteria.append(("Min break-even >= ₹1L", min_ok, f"Actual: ₹{breakeven_costs.min():.1f}L"))
     criteria.append(("Max break-even <= ₹25L", max_ok, f"Actual: ₹{breakeven_costs.max():.1f}L"))
 
+    # Sum and count per (intervention, region, location) cell in one grouped
+    # pass; pooling cells gives the same mean as the matching rows of df
+    group_cols = [c for c in ('intervention', 'region', 'location') if c in df.columns]
+    if group_cols:
+        cell_totals = df.groupby(group_cols, observed=True)[bcr3_col].agg(['sum', 'count'])
+
+    def pooled_mean(level, labels):
+        cells = cell_totals[cell_totals.index.get_level_values(level).isin(labels)]
+        return cells['sum'].sum() / cells['count'].sum() if len(cells) else np.nan
+
     # 2. Check regional patterns
     if 'region' in df.columns:
-        south_west = df[df['region'].isin(['south', 'west'])][bcr3_col].mean()
-        north_east = df[df['region'].isin(['north', 'east'])][bcr3_col].mean()
+        south_west = pooled_mean('region', ['south', 'west'])
+        north_east = pooled_mean('region', ['north', 'east'])
         regional_pattern_ok = south_west > north_east
         criteria.append(("South/West > North/East", regional_pattern_ok,
                         f"S/W: ₹{south_west:.1f}L vs N/E: ₹{north_east:.1f}L"))
 
     # 3. Urban > Rural
     if 'location' in df.columns:
-        urban = df[df['location'] == 'urban'][bcr3_col].mean()
-        rural = df[df['location'] == 'rural'][bcr3_col].mean()
+        urban = pooled_mean('location', ['urban'])
+        rural = pooled_mean('location', ['rural'])
         urban_gt_rural = urban > rural
         criteria.append(("Urban > Rural", urban_gt_rural, f"Urban: ₹{urban:.1f}L vs Rural: ₹{rural:.1f}L"))
 
     # 4. Apprenticeship break-even reasonable for training costs
     # Typical apprenticeship cost: ₹50k - ₹300k
     if 'intervention' in df.columns:
-        app_breakeven = df[df['intervention'] == 'apprenticeship'][bcr3_col]
-        app_reasonable = app_breakeven.mean() >= 5.0  # Can sustain ₹5L+ cost at BCR=3
+        app_breakeven = pooled_mean('intervention', ['apprenticeship'])
+        app_reasonable = app_breakeven >= 5.0  # Can sustain ₹5L+ cost at BCR=3
         criteria.append(("Apprenticeship can sustain ₹5L+ cost", app_reasonable,
-                        f"Avg break-even: ₹{app_breakeven.mean():.1f}L"))
+                        f"Avg break-even: ₹{app_breakeven:.1f}L"))
 
     # Save validation CSV
     validation_df = df[[c for c in ['scenario_id', 'intervention', 'gender', 'location', 'region', bcr3_col] if c in df.columns]].copy()
-    validation_df.to_csv(OUTPUT_DIR / 'validation_breakeven_check.csv', index=False)
+    _write_csv(validation_df, OUTPUT_DIR / 'validation_breakeven_check.csv')
 
     # Overall pass/fail
     all_passed = all(c[1] for c in criteria)
@@ -387,6 +531,13 @@ def check_breakeven_costs():
 # CHECK 4: Regional Heterogeneity Logic
 # ============================================================================
 
+def _region_ranks(regional_means: pd.Series):
+    """Regions and their mean LNPV as arrays, highest mean first."""
+    means = regional_means.to_numpy()
+    order = np.argsort(-means, kind='stable')
+    return regional_means.index.to_numpy()[order], means[order]
+
+
 def check_regional_heterogeneity():
     """
     Validate regional rankings make economic sense.
@@ -402,25 +553,32 @@ def check_regional_heterogeneity():
     print("="*80)
 
     # Read LNPV results
-    df = pd.read_csv(model_dir / "outputs" / "lnpv_results_v4.csv")
+    df = _load_csv(str(model_dir / "outputs" / "lnpv_results_v4.csv"), 'lnpv')
 
     # Standardize column names
     if 'Intervention' in df.columns:
-        df.columns = [c.lower().replace(' ', '_').replace('(', '').replace(')', '').replace('₹_', '') for c in df.columns]
+        df = df.rename(columns=_normalize_column)
 
-    # Create lnpv_lakhs column if it doesn't exist
-    if 'lnpv_lakhs' not in df.columns and 'lnpv' in df.columns:
-        df['lnpv_lakhs'] = df['lnpv'] / 100000
+    df = _ensure_lnpv_lakhs(df)
 
     criteria = []
 
+    # Regional average LNPV for every intervention in one grouped pass;
+    # the ranking criteria and the rankings CSV both read from it
+    regional_means = (
+        df.groupby(['intervention', 'region'], observed=True)['lnpv_lakhs'].mean()
+    )
+    interventions = regional_means.index.unique('intervention')
+    region_ranks = {
+        intervention: (_region_ranks(regional_means.xs(intervention, level='intervention'))
+                       if intervention in interventions else (np.array([]), np.array([])))
+        for intervention in ['rte', 'apprenticeship']
+    }
+
     # Check for each intervention
     for intervention in ['rte', 'apprenticeship']:
-        int_df = df[df['intervention'].str.lower() == intervention]
-
         # Regional rankings by average LNPV
-        regional_avg = int_df.groupby('region')['lnpv_lakhs'].mean().sort_values(ascending=False)
-        rankings = regional_avg.index.tolist()
+        rankings = region_ranks[intervention][0].tolist()
 
         # 1. South should rank #1 or #2
         south_rank = rankings.index('South') + 1 if 'South' in rankings else 5
@@ -432,22 +590,26 @@ def check_regional_heterogeneity():
         east_ok = east_rank >= 3
         criteria.append((f"{intervention}: East rank #3-4", east_ok, f"Actual rank: #{east_rank}"))
 
-    # 3. Urban > Rural within each region
-    urban_rural_ok = True
-    urban_rural_details = []
-    for region in df['region'].unique():
-        region_df = df[df['region'] == region]
-        urban_avg = region_df[region_df['location'] == 'Urban']['lnpv_lakhs'].mean()
-        rural_avg = region_df[region_df['location'] == 'Rural']['lnpv_lakhs'].mean()
-        if urban_avg <= rural_avg:
-            urban_rural_ok = False
-            urban_rural_details.append(f"{region}: Urban ₹{urban_avg:.1f}L <= Rural ₹{rural_avg:.1f}L")
+    # 3. Urban > Rural within each region: one grouped mean per (region, location)
+    location_avg = (
+        df.groupby(['region', df['location'].str.capitalize()], observed=True)['lnpv_lakhs']
+        .mean()
+        .unstack('location')
+        .reindex(columns=['Urban', 'Rural'])
+    )
+    violations = location_avg[location_avg['Urban'] <= location_avg['Rural']]
+    urban_rural_ok = violations.empty
+    urban_rural_details = [
+        f"{region}: Urban ₹{row.Urban:.1f}L <= Rural ₹{row.Rural:.1f}L"
+        for region, row in violations.iterrows()
+    ]
     criteria.append(("Urban > Rural all regions", urban_rural_ok,
                     "All passed" if urban_rural_ok else "; ".join(urban_rural_details)))
 
     # 4. Male ≈ Female (within 50% - gender gap is real but limited)
-    male_avg = df[df['gender'] == 'Male']['lnpv_lakhs'].mean()
-    female_avg = df[df['gender'] == 'Female']['lnpv_lakhs'].mean()
+    gender_avg = df.groupby('gender', observed=True)['lnpv_lakhs'].mean()
+    male_avg = gender_avg.get('Male', np.nan)
+    female_avg = gender_avg.get('Female', np.nan)
     gender_ratio = male_avg / female_avg
     gender_ok = 0.5 <= gender_ratio <= 2.0
     criteria.append(("Gender ratio 0.5-2.0", gender_ok, f"M/F ratio: {gender_ratio:.2f}"))
@@ -455,9 +617,7 @@ def check_regional_heterogeneity():
     # Save regional rankings CSV
     ranking_data = []
     for intervention in ['rte', 'apprenticeship']:
-        int_df = df[df['intervention'].str.lower() == intervention]
-        regional_avg = int_df.groupby('region')['lnpv_lakhs'].mean().sort_values(ascending=False)
-        for rank, (region, lnpv) in enumerate(regional_avg.items(), 1):
+        for rank, (region, lnpv) in enumerate(zip(*region_ranks[intervention]), 1):
             ranking_data.append({
                 'intervention': intervention,
                 'region': region,
@@ -465,7 +625,7 @@ def check_regional_heterogeneity():
                 'avg_lnpv_lakhs': lnpv
             })
 
-    pd.DataFrame(ranking_data).to_csv(OUTPUT_DIR / 'validation_regional_rankings.csv', index=False)
+    _write_csv(pd.DataFrame(ranking_data), OUTPUT_DIR / 'validation_regional_rankings.csv')
 
     # Overall pass/fail
     all_passed = all(c[1] for c in criteria)
@@ -480,6 +640,54 @@ def check_regional_heterogeneity():
 # CHECK 5: Treatment Effect Decay (Apprenticeship)
 # ============================================================================
 
+# Reference annual wage (₹20,000/month) that scales the apprenticeship
+# premium to a proportion, as a reciprocal
+_INV_REFERENCE_ANNUAL_WAGE = 1.0 / (12 * 20000)
+
+
+@functools.lru_cache(maxsize=1)
+def _decay_inputs():
+    """
+    (half-life, proportional initial premium) for check 5, read from a
+    default ParameterRegistry built on first use and reused afterwards.
+    """
+    params = ParameterRegistry()
+    return (params.APPRENTICE_DECAY_HALFLIFE.value,
+            params.APPRENTICE_INITIAL_PREMIUM.value * _INV_REFERENCE_ANNUAL_WAGE)
+
+
+@functools.lru_cache(maxsize=1)
+def _plot_decay(halflife: float, working_years: int):
+    """
+    Save validation_decay_trajectory.png for check 5.
+
+    The figure depends only on the half-life and horizon, so repeated
+    validation runs in one process skip the redraw and savefig.
+    """
+    years = np.arange(working_years, dtype=np.float64)
+
+    plt = _pyplot()
+    fig, ax = plt.subplots(figsize=(10, 6))
+
+    ax.plot(years, np.exp2(-years / halflife) * 100, 'b-', linewidth=2, label='Apprenticeship Premium')
+    ax.axhline(y=50, color='r', linestyle='--', alpha=0.5, label=f'50% at half-life ({halflife} years)')
+    ax.axhline(y=25, color='orange', linestyle='--', alpha=0.5, label='25% at 2×half-life')
+    ax.axvline(x=halflife, color='r', linestyle=':', alpha=0.5)
+    ax.axvline(x=2*halflife, color='orange', linestyle=':', alpha=0.5)
+
+    ax.set_xlabel('Years Since Apprenticeship Completion')
+    ax.set_ylabel('Premium as % of Initial')
+    ax.set_title(f'Apprenticeship Wage Premium Decay (Half-life = {halflife} years)')
+    ax.legend()
+    ax.grid(True, alpha=0.3)
+    ax.set_xlim(0, working_years)
+    ax.set_ylim(0, 110)
+
+    plt.tight_layout()
+    plt.savefig(OUTPUT_DIR / 'validation_decay_trajectory.png', dpi=150, bbox_inches='tight')
+    plt.close()
+
+
 def check_treatment_decay():
     """
     Validate apprenticeship wage premium decays correctly.
@@ -493,23 +701,25 @@ def check_treatment_decay():
     print("CHECK 5: Treatment Effect Decay")
     print("="*80)
 
-    params = ParameterRegistry()
-    wage_model = MincerWageModel(params)
-
     # Generate apprenticeship treatment trajectory with decay
     working_years = 40
-    halflife = params.APPRENTICE_DECAY_HALFLIFE.value
-    initial_premium = params.APPRENTICE_INITIAL_PREMIUM.value / (12 * 20000)  # Proportional
+    halflife, initial_premium = _decay_inputs()
 
     # Calculate premium at each year
-    years = np.arange(working_years)
-    decay_factors = np.exp(-np.log(2) / halflife * years)
-    premium_trajectory = initial_premium * decay_factors
+    # 2^(-t/h): exactly 0.5 at t = h for an integer half-life
+    if NUMBA_AVAILABLE:
+        # Compiled kernel: trajectory and monotonicity in one loop
+        premium_trajectory, is_monotonic = _decay_kernel(
+            working_years, float(halflife), float(initial_premium)
+        )
+    else:
+        years = np.arange(working_years, dtype=np.float64)
+        premium_trajectory = initial_premium * np.exp2(-years / halflife)
+        is_monotonic = bool(np.all(np.diff(premium_trajectory) <= 0))
 
     criteria = []
 
     # 1. Monotonic decay
-    is_monotonic = np.all(np.diff(premium_trajectory) <= 0)
     criteria.append(("Premium decays monotonically", is_monotonic,
                     f"All differences ≤ 0: {is_monotonic}"))
 
@@ -528,26 +738,8 @@ def check_treatment_decay():
         criteria.append((f"Premium at t={int(2*halflife)} ≈ 25%", two_h_ok,
                         f"Actual: {premium_at_2h/initial_premium*100:.1f}%"))
 
-    # Plot decay trajectory
-    fig, ax = plt.subplots(figsize=(10, 6))
-
-    ax.plot(years, premium_trajectory / initial_premium * 100, 'b-', linewidth=2, label='Apprenticeship Premium')
-    ax.axhline(y=50, color='r', linestyle='--', alpha=0.5, label=f'50% at half-life ({halflife} years)')
-    ax.axhline(y=25, color='orange', linestyle='--', alpha=0.5, label='25% at 2×half-life')
-    ax.axvline(x=halflife, color='r', linestyle=':', alpha=0.5)
-    ax.axvline(x=2*halflife, color='orange', linestyle=':', alpha=0.5)
-
-    ax.set_xlabel('Years Since Apprenticeship Completion')
-    ax.set_ylabel('Premium as % of Initial')
-    ax.set_title(f'Apprenticeship Wage Premium Decay (Half-life = {halflife} years)')
-    ax.legend()
-    ax.grid(True, alpha=0.3)
-    ax.set_xlim(0, working_years)
-    ax.set_ylim(0, 110)
-
-    plt.tight_layout()
-    plt.savefig(OUTPUT_DIR / 'validation_decay_trajectory.png', dpi=150, bbox_inches='tight')
-    plt.close()
+    # Plot decay trajectory (drawn once per process for given inputs)
+    _plot_decay(halflife, working_years)
 
     # Overall pass/fail
     all_passed = all(c[1] for c in criteria)
@@ -580,27 +772,29 @@ def check_sensitivity_consistency():
     # 1. Check scenario bounds
     scenarios_path = model_dir / "outputs" / "sensitivity" / "scenarios" / "scenario_bounds.csv"
     if scenarios_path.exists():
-        scenarios_df = pd.read_csv(scenarios_path)
-
-        # For each scenario, check Conservative < Moderate < Optimistic
-        scenario_ordering_ok = True
-        for scenario_id in scenarios_df['scenario'].str.replace('conservative|moderate|optimistic', '', regex=True).unique():
-            if scenario_id.startswith('_'):
-                scenario_id = scenario_id[1:]
-            cons = scenarios_df[(scenarios_df['scenario'].str.startswith('conservative')) &
-                               (scenarios_df['scenario'].str.contains(scenario_id))]['lnpv_lakhs']
-            mod = scenarios_df[(scenarios_df['scenario'].str.startswith('moderate')) &
-                              (scenarios_df['scenario'].str.contains(scenario_id))]['lnpv_lakhs']
-            opt = scenarios_df[(scenarios_df['scenario'].str.startswith('optimistic')) &
-                              (scenarios_df['scenario'].str.contains(scenario_id))]['lnpv_lakhs']
-
-            if len(cons) > 0 and len(mod) > 0 and len(opt) > 0:
-                if not (cons.values[0] <= mod.values[0] <= opt.values[0]):
-                    scenario_ordering_ok = False
-                    break
+        scenarios_df = _load_csv(str(scenarios_path), 'scenarios')
+
+        # For each scenario, check Conservative < Moderate < Optimistic:
+        # split '<tier>_<key>' on the first '_' (no regex), pivot to one row per key
+        tiers = ['conservative', 'moderate', 'optimistic']
+        parts = (scenarios_df['scenario'].str.split('_', n=1, expand=True)
+                 .reindex(columns=[0, 1]).fillna({1: ''}))
+        pivot = (
+            scenarios_df.assign(tier=parts[0], key=parts[1])
+            .loc[lambda d: d['tier'].isin(tiers)]
+            .pivot_table(index='key', columns='tier', values='lnpv_lakhs', aggfunc='first',
+                         observed=True)
+            .reindex(columns=tiers)
+            .dropna()
+        )
+        ordered = ((pivot['conservative'] <= pivot['moderate']) &
+                   (pivot['moderate'] <= pivot['optimistic']))
+        scenario_ordering_ok = bool(ordered.all())
+        n_violations = int((~ordered).sum())
 
         criteria.append(("Cons ≤ Mod ≤ Opt all scenarios", scenario_ordering_ok,
-                        "Ordering verified" if scenario_ordering_ok else "Ordering violated"))
+                        "Ordering verified" if scenario_ordering_ok
+                        else f"Ordering violated ({n_violations} scenarios)"))
     else:
         # Calculate scenarios manually
         from economic_core_v4 import run_scenario_comparison
@@ -615,15 +809,15 @@ def check_sensitivity_consistency():
     # 2. Check Monte Carlo median vs baseline
     mc_path = model_dir / "outputs" / "sensitivity" / "monte_carlo" / "monte_carlo_distributions.csv"
     if mc_path.exists():
-        mc_df = pd.read_csv(mc_path)
+        mc_df = _load_csv(str(mc_path), 'monte_carlo')
         baseline_path = model_dir / "outputs" / "sensitivity" / "breakeven" / "breakeven_analysis_32scenarios.csv"
         if baseline_path.exists():
-            baseline_df = pd.read_csv(baseline_path)
+            baseline_df = _load_csv(str(baseline_path), 'breakeven')
 
             # Compare median to baseline for a sample scenario
             sample_scenario = 'rte_male_urban_west'
-            mc_median = mc_df[mc_df['scenario_id'] == sample_scenario]['median'].values[0]
-            baseline_lnpv = baseline_df[baseline_df['scenario_id'] == sample_scenario]['lnpv'].values[0]
+            mc_median = mc_df.loc[mc_df['scenario_id'] == sample_scenario, 'median'].iat[0]
+            baseline_lnpv = baseline_df.loc[baseline_df['scenario_id'] == sample_scenario, 'lnpv'].iat[0]
 
             pct_diff = abs(mc_median - baseline_lnpv) / baseline_lnpv * 100
             mc_baseline_close = pct_diff < 15  # Within 15%
@@ -635,14 +829,14 @@ def check_sensitivity_consistency():
     app_tornado = model_dir / "outputs" / "sensitivity_tornado_apprenticeship.csv"
 
     if rte_tornado.exists():
-        rte_t = pd.read_csv(rte_tornado)
+        rte_t = _load_csv(str(rte_tornado), 'tornado')
         rte_top3 = rte_t.nsmallest(3, 'rank')['parameter_name'].tolist()
         rte_drivers_ok = 'P_FORMAL_RTE' in rte_top3
         criteria.append(("RTE top driver: P_FORMAL_RTE", rte_drivers_ok,
                         f"Top 3: {', '.join(rte_top3)}"))
 
     if app_tornado.exists():
-        app_t = pd.read_csv(app_tornado)
+        app_t = _load_csv(str(app_tornado), 'tornado')
         app_top3 = app_t.nsmallest(3, 'rank')['parameter_name'].tolist()
         app_drivers_ok = 'P_FORMAL_APPRENTICE' in app_top3
         criteria.append(("App top driver: P_FORMAL_APPRENTICE", app_drivers_ok,
@@ -707,17 +901,13 @@ def check_assumptions_documented():
         ('RTE_RETENTION_FUNNEL', RTE_RETENTION_FUNNEL),
     ]
 
-    missing_sources = []
-    tier1_params = []
-    for name, param in params_to_check:
-        if not param.source or param.source == "" or 'Assumed' in param.source:
-            missing_sources.append(name)
-        if param.tier == 1:
-            tier1_params.append(name)
-
-    # Check for documented assumptions
-    no_missing_sources = len([m for m in missing_sources if 'Assumed' not in
-                              next((p.source for n, p in params_to_check if n == m), '')]) == 0
+    param_map = dict(params_to_check)
+    missing_sources = [name for name, param in params_to_check
+                       if not param.source or 'Assumed' in param.source]
+    tier1_params = [name for name, param in params_to_check if param.tier == 1]
+
+    # Check for documented assumptions ('Assumed' sources are documented)
+    no_missing_sources = all('Assumed' in param_map[name].source for name in missing_sources)
     criteria.append(("All params have sources", no_missing_sources,
                     f"Assumed/derived: {', '.join(missing_sources)}" if missing_sources else "All documented"))
 
@@ -726,23 +916,23 @@ def check_assumptions_documented():
     criteria.append(("Tier 1 params identified", tier1_ok,
                     f"Tier 1: {', '.join(tier1_params)}"))
 
-    # Create assumptions document
-    assumptions_content = f"""# Model Assumptions Documentation
+    # Create assumptions document (sections collected in a list, joined once)
+    parts = [f"""# Model Assumptions Documentation
 Generated: {datetime.now().strftime('%Y-%m-%d %H:%M')}
 
 ## Parameter Sources and Assumptions
 
 | Parameter | Value | Tier | Source | Assumption/Limitation |
 |-----------|-------|------|--------|----------------------|
-"""
+"""]
 
     for name, param in params_to_check:
         assumption = "Direct empirical" if 'Assumed' not in param.source else "Model assumption"
         if 'DEPRECATED' in param.source:
             continue
-        assumptions_content += f"| {name} | {param.value} | {param.tier} | {param.source[:50]}... | {assumption} |\n"
+        parts.append(f"| {name} | {param.value} | {param.tier} | {param.source[:50]}... | {assumption} |\n")
 
-    assumptions_content += """
+    parts.append("""
 ## Key Assumptions
 
 1. **Sector-Specific Wage Growth**: Formal sector workers see 1.5%/year career progression while informal stagnates (-0.2%/year). This captures growing inequality.
@@ -759,25 +949,23 @@ Generated: {datetime.now().strftime('%Y-%m-%d %H:%M')}
 
 These parameters have the largest impact on NPV and highest uncertainty:
 
-"""
+""")
 
     for name in tier1_params:
-        param = next((p for n, p in params_to_check if n == name), None)
-        if param:
-            assumptions_content += f"- **{name}**: {param.value} (range: {param.sensitivity_range})\n"
+        param = param_map[name]
+        parts.append(f"- **{name}**: {param.value} (range: {param.sensitivity_range})\n")
 
-    assumptions_content += """
+    parts.append("""
 ## Limitations
 
 1. No longitudinal tracking of RTE beneficiaries exists (RTE_RETENTION_FUNNEL is estimated)
 2. Apprenticeship wage premium decay rate has no India-specific empirical basis
 3. Sector-specific wage growth rates are derived from inequality trends, not individual-level panel data
 4. Control group P(Formal) may be understated if selection effects are strong
-"""
+""")
 
     # Save assumptions document
-    with open(OUTPUT_DIR / 'model_assumptions.md', 'w') as f:
-        f.write(assumptions_content)
+    (OUTPUT_DIR / 'model_assumptions.md').write_text("".join(parts))
 
     criteria.append(("Assumptions documented", True, "model_assumptions.md created"))
 
@@ -813,7 +1001,8 @@ def check_decomposition():
         log_result("Check 8: Decomposition", False, "Decomposition file not found")
         return False, []
 
-    df = pd.read_csv(decomp_path)
+    # All columns kept: the frame is written back out as validation_decomposition.csv
+    df = _load_csv(str(decomp_path), 'decomposition', all_columns=True).copy()
 
     criteria = []
 
@@ -844,7 +1033,7 @@ def check_decomposition():
                     f"Placement: {placement_positive}, Mincer: {mincer_positive}"))
 
     # Save validation decomposition CSV
-    df.to_csv(OUTPUT_DIR / 'validation_decomposition.csv', index=False)
+    _write_csv(df, OUTPUT_DIR / 'validation_decomposition.csv')
 
     # Overall pass/fail
     all_passed = all(c[1] for c in criteria)
@@ -859,48 +1048,66 @@ def check_decomposition():
 # MAIN EXECUTION
 # ============================================================================
 
-def run_all_validations():
-    """Run all validation checks and generate report."""
-    print("\n" + "="*80)
-    print("MILESTONE 4: VALIDATION & QA - RWF ECONOMIC IMPACT MODEL")
-    print("="*80)
-    print(f"Timestamp: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
-    print(f"Output Directory: {OUTPUT_DIR}")
-
-    # Run all checks
-    results = []
-    results.append(("Check 1: Age-Wage Profiles", *check_age_wage_profiles()))
-    results.append(("Check 2: NPV Magnitude", *check_npv_magnitude()))
-    results.append(("Check 3: Break-Even Costs", *check_breakeven_costs()))
-    results.append(("Check 4: Regional Heterogeneity", *check_regional_heterogeneity()))
-    results.append(("Check 5: Treatment Decay", *check_treatment_decay()))
-    results.append(("Check 6: Sensitivity Consistency", *check_sensitivity_consistency()))
-    results.append(("Check 7: Assumptions Documented", *check_assumptions_documented()))
-    results.append(("Check 8: Decomposition", *check_decomposition()))
-
-    # Generate summary report
-    print("\n" + "="*80)
-    print("VALIDATION SUMMARY")
-    print("="*80)
-
-    passed = sum(1 for r in results if r[1])
-    total = len(results)
+def _memoize_check(check_fn):
+    """
+    Cache a check's (passed, criteria) result per parameter registry VERSION.
 
-    for check_name, passed_flag, criteria in results:
-        status = "✅ PASS" if passed_flag else "❌ FAIL"
-        print(f"{status}: {check_name}")
+    Checks are deterministic for a given registry, so repeated runs in one
+    process (e.g. from a notebook) return the first result without
+    recomputing, re-plotting or logging it again. Call .cache_clear() after
+    regenerating the model output CSVs a check reads.
+    """
+    cache = {}
+
+    @functools.wraps(check_fn)
+    def wrapper():
+        if VERSION not in cache:
+            cache[VERSION] = check_fn()
+        return cache[VERSION]
+
+    # Exposed so run_all_validations can store results computed in workers
+    wrapper.cache = cache
+    wrapper.cache_clear = cache.clear
+    return wrapper
+
+
+check_age_wage_profiles = _memoize_check(check_age_wage_profiles)
+check_npv_magnitude = _memoize_check(check_npv_magnitude)
+check_breakeven_costs = _memoize_check(check_breakeven_costs)
+check_regional_heterogeneity = _memoize_check(check_regional_heterogeneity)
+check_treatment_decay = _memoize_check(check_treatment_decay)
+check_sensitivity_consistency = _memoize_check(check_sensitivity_consistency)
+check_assumptions_documented = _memoize_check(check_assumptions_documented)
+check_decomposition = _memoize_check(check_decomposition)
+
+# (name, check function) in report order
+VALIDATION_CHECKS = [
+    ("Check 1: Age-Wage Profiles", check_age_wage_profiles),
+    ("Check 2: NPV Magnitude", check_npv_magnitude),
+    ("Check 3: Break-Even Costs", check_breakeven_costs),
+    ("Check 4: Regional Heterogeneity", check_regional_heterogeneity),
+    ("Check 5: Treatment Decay", check_treatment_decay),
+    ("Check 6: Sensitivity Consistency", check_sensitivity_consistency),
+    ("Check 7: Assumptions Documented", check_assumptions_documented),
+    ("Check 8: Decomposition", check_decomposition),
+]
+
+
+def _run_check_logged(index: int):
+    """
+    Worker for run_all_validations: run VALIDATION_CHECKS[index] and return
+    (passed, criteria, log), where log holds the VALIDATION_RESULTS rows the
+    check appended in this process.
+    """
+    start = len(VALIDATION_RESULTS['check_name'])
+    passed, criteria = VALIDATION_CHECKS[index][1]()
+    log = {key: rows[start:] for key, rows in VALIDATION_RESULTS.items()}
+    return passed, criteria, log
 
-    print("\n" + "-"*40)
-    print(f"OVERALL: {passed}/{total} checks passed")
-    if passed == total:
-        print("🎉 ALL VALIDATION CHECKS PASSED!")
-    else:
-        print("⚠️ Some checks failed - review details above")
-    print("-"*40)
 
-    # Save validation report
-    report_content = f"""# Milestone 4: Validation & QA Report
-Generated: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}
+# Fixed parts of validation_report.md; only the header is filled in per run
+_REPORT_HEADER = """# Milestone 4: Validation & QA Report
+Generated: {generated}
 
 ## Summary
 
@@ -910,18 +1117,7 @@ Generated: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}
 
 """
 
-    for check_name, passed_flag, criteria in results:
-        status = "✅ PASS" if passed_flag else "❌ FAIL"
-        report_content += f"### {check_name}\n\n"
-        report_content += f"**Status:** {status}\n\n"
-        report_content += "| Criterion | Status | Details |\n"
-        report_content += "|-----------|--------|--------|\n"
-        for crit_name, crit_pass, crit_detail in criteria:
-            crit_status = "✅" if crit_pass else "❌"
-            report_content += f"| {crit_name} | {crit_status} | {crit_detail} |\n"
-        report_content += "\n"
-
-    report_content += """
+_REPORT_FOOTER = """
 ## Deliverables Generated
 
 - `validation_age_wage_profiles.png` - Age-wage trajectory plots
@@ -954,12 +1150,89 @@ Generated: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}
 - Decomposition validates: Placement Effect (~80%) + Mincer Effect (~20%) = Total
 """
 
-    with open(OUTPUT_DIR / 'validation_report.md', 'w') as f:
-        f.write(report_content)
 
-    # Also save results DataFrame
-    results_df = pd.DataFrame(VALIDATION_RESULTS)
-    results_df.to_csv(OUTPUT_DIR / 'validation_results.csv', index=False)
+def run_all_validations(n_jobs: int = 1):
+    """
+    Run all validation checks and generate report.
+
+    The checks are independent; with n_jobs > 1 (or -1 for all cores) the
+    ones not already cached run in worker processes. Their console output
+    then interleaves, but results, log rows and the report keep check order.
+    """
+    print("\n" + "="*80)
+    print("MILESTONE 4: VALIDATION & QA - RWF ECONOMIC IMPACT MODEL")
+    print("="*80)
+    # One timestamp for the console header and the report
+    timestamp = datetime.now().strftime('%Y-%m-%d %H:%M:%S')
+    print(f"Timestamp: {timestamp}")
+    print(f"Output Directory: {OUTPUT_DIR}")
+
+    # Warm the CSV cache before the checks run
+    _prefetch_csvs()
+
+    # Run all checks
+    if n_jobs == -1:
+        n_jobs = os.cpu_count() or 1
+    pending = [i for i, (_, check_fn) in enumerate(VALIDATION_CHECKS)
+               if VERSION not in check_fn.cache]
+    if n_jobs > 1 and len(pending) > 1:
+        with ProcessPoolExecutor(max_workers=min(n_jobs, len(pending))) as executor:
+            outcomes = list(executor.map(_run_check_logged, pending))
+        # Merge worker log rows and results back in check order
+        for i, (passed_flag, criteria, log) in zip(pending, outcomes):
+            for key, rows in log.items():
+                VALIDATION_RESULTS[key].extend(rows)
+            VALIDATION_CHECKS[i][1].cache[VERSION] = (passed_flag, criteria)
+
+    results = [(name, *check_fn()) for name, check_fn in VALIDATION_CHECKS]
+    # Parallel per-check columns for the summary and report loops
+    names, flags, criteria_all = zip(*results)
+    flags = np.fromiter(flags, dtype=bool, count=len(names))
+
+    # Generate summary report
+    print("\n" + "="*80)
+    print("VALIDATION SUMMARY")
+    print("="*80)
+
+    passed = int(flags.sum())
+    total = flags.size
+
+    for check_name, passed_flag in zip(names, flags):
+        status = "✅ PASS" if passed_flag else "❌ FAIL"
+        print(f"{status}: {check_name}")
+
+    print("\n" + "-"*40)
+    print(f"OVERALL: {passed}/{total} checks passed")
+    if passed == total:
+        print("🎉 ALL VALIDATION CHECKS PASSED!")
+    else:
+        print("⚠️ Some checks failed - review details above")
+    print("-"*40)
+
+    # Save validation report, streamed through one buffered file handle
+    with open(OUTPUT_DIR / 'validation_report.md', 'w', buffering=1 << 20) as f:
+        f.write(_REPORT_HEADER.format(
+            generated=timestamp, passed=passed, total=total
+        ))
+
+        for check_name, passed_flag, criteria in zip(names, flags, criteria_all):
+            status = "✅ PASS" if passed_flag else "❌ FAIL"
+            rows = "".join(f"| {crit_name} | {'✅' if crit_pass else '❌'} | {crit_detail} |\n"
+                           for crit_name, crit_pass, crit_detail in criteria)
+            # One write per check section
+            f.write(f"### {check_name}\n\n"
+                    f"**Status:** {status}\n\n"
+                    "| Criterion | Status | Details |\n"
+                    "|-----------|--------|--------|\n"
+                    f"{rows}\n")
+
+        f.write(_REPORT_FOOTER)
+
+    # Also save the results log (a few rows of strings: stdlib csv, no DataFrame)
+    with open(OUTPUT_DIR / 'validation_results.csv', 'w', newline='') as f:
+        writer = csv.writer(f, lineterminator='\n')
+        writer.writerow(VALIDATION_RESULTS.keys())
+        writer.writerows(zip(*VALIDATION_RESULTS.values()))
 
     print(f"\n📄 Validation report saved to: {OUTPUT_DIR / 'validation_report.md'}")
 
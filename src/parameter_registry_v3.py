@@ -71,18 +71,28 @@ SCENARIO FRAMEWORK (Section 9B - Updated Dec 26, 2025):
 - Optimistic: 90% apprentice placement, 50% RTE formal entry (capped per Anand)
 """
 
+import sys
 from dataclasses import dataclass
-from typing import Dict, List, Optional, Tuple
+from functools import lru_cache
+from types import MappingProxyType
+from typing import Dict, List, Mapping, Optional, Tuple
 import numpy as np
 
+# Registry version (matches VERSION in the module docstring); bump whenever
+# parameter values change so results cached against it are invalidated
+VERSION = "3.3"
+
 # =============================================================================
 # PARAMETER METADATA STRUCTURE
 # =============================================================================
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class Parameter:
     """
     Container for model parameters with full documentation.
+
+    Immutable (use dataclasses.replace(param, value=x) for a modified copy)
+    and slotted, so instances carry no per-instance __dict__.
     
     Attributes:
         name: Parameter name
@@ -122,6 +132,48 @@ class Parameter:
     npv_impact_pct_app: Optional[float] = None
     last_sensitivity_run: Optional[str] = None
 
+    def __post_init__(self):
+        # Share one str object per distinct symbol/unit/source across the
+        # registry (many parameters repeat e.g. "INR/month"); the dataclass
+        # is frozen, hence object.__setattr__
+        for name in ('symbol', 'unit', 'source'):
+            object.__setattr__(self, name, sys.intern(getattr(self, name)))
+
+    def sample(self, n: int, rng: np.random.Generator) -> np.ndarray:
+        """
+        Draw n Monte Carlo samples in one vectorized Generator call.
+
+        Same distributions as sample_parameter(), but drawn from the given
+        rng instead of the global NumPy random state.
+        """
+        sampler = _SAMPLERS.get(self.sampling_method)
+        if sampler is None:
+            raise ValueError(f"Unknown sampling method: {self.sampling_method}")
+        return sampler(self, n, rng)
+
+
+def _sample_beta(param: Parameter, n: int, rng: np.random.Generator) -> np.ndarray:
+    """Beta(alpha, beta) draws scaled to the parameter's sensitivity range."""
+    alpha, beta = param.sampling_params
+    low, high = param.sensitivity_range
+    return low + rng.beta(alpha, beta, n) * (high - low)
+
+
+def _sample_fixed(param: Parameter, n: int, rng: np.random.Generator) -> np.ndarray:
+    """Point value repeated n times; tuple values broadcast to shape (n, len)."""
+    value = np.asarray(param.value, dtype=float)
+    return np.broadcast_to(value, (n,) + value.shape).copy()
+
+
+# sampling_method -> vectorized sampler(param, n, rng) for Parameter.sample
+_SAMPLERS = {
+    'uniform': lambda param, n, rng: rng.uniform(*param.sampling_params, n),
+    'normal': lambda param, n, rng: rng.normal(*param.sampling_params, n),
+    'triangular': lambda param, n, rng: rng.triangular(*param.sampling_params, n),
+    'beta': _sample_beta,
+    'fixed': _sample_fixed,
+}
+
 # =============================================================================
 # SECTION 1: WAGE EQUATION PARAMETERS (Mincer Returns)
 # =============================================================================
@@ -364,15 +416,53 @@ BASELINE_WAGES = {
 # SECTION 2B: EMBEDDED RATIO CALCULATION
 # =============================================================================
 
+# Structure-of-arrays copy of BASELINE_WAGES for integer-indexed lookups.
+# Axis order matches economic_core_v4's Location (URBAN=0, RURAL=1) and
+# Gender (MALE=0, FEMALE=1) enum values; BASELINE_WAGES stays the source.
+_WAGE_LOCATIONS = ('urban', 'rural')
+_WAGE_GENDERS = ('male', 'female')
+_WAGE_EDUCATION_LEVELS = ('secondary_10yr', 'higher_secondary_12yr', 'casual_informal')
+
+_WAGE_LOCATION_INDEX = {name: i for i, name in enumerate(_WAGE_LOCATIONS)}
+_WAGE_GENDER_INDEX = {name: i for i, name in enumerate(_WAGE_GENDERS)}
+
+# Monthly wage values, shape (location, gender, education)
+_WAGE_VALUES = np.array([
+    [[BASELINE_WAGES[f"{loc}_{gen}"][edu].value for edu in _WAGE_EDUCATION_LEVELS]
+     for gen in _WAGE_GENDERS]
+    for loc in _WAGE_LOCATIONS
+], dtype=float)
+# Sensitivity (min, max), shape (location, gender, education, 2)
+_WAGE_RANGES = np.array([
+    [[BASELINE_WAGES[f"{loc}_{gen}"][edu].sensitivity_range for edu in _WAGE_EDUCATION_LEVELS]
+     for gen in _WAGE_GENDERS]
+    for loc in _WAGE_LOCATIONS
+], dtype=float)
+_WAGE_VALUES.flags.writeable = False
+_WAGE_RANGES.flags.writeable = False
+
+
+def get_wage(loc_i: int, gen_i: int, edu_i: int) -> float:
+    """
+    Baseline monthly wage by index: location (0=urban, 1=rural), gender
+    (0=male, 1=female) and education (0=secondary_10yr,
+    1=higher_secondary_12yr, 2=casual_informal).
+    """
+    return float(_WAGE_VALUES[loc_i, gen_i, edu_i])
+
+
+# Embedded ratio (salaried secondary / casual informal wage) for each of the
+# four (location, gender) pairs, computed once at import
+_EMBEDDED_RATIO = {
+    (loc, gen): float(_WAGE_VALUES[loc_i, gen_i, 0] / _WAGE_VALUES[loc_i, gen_i, 2])
+    for loc, loc_i in _WAGE_LOCATION_INDEX.items()
+    for gen, gen_i in _WAGE_GENDER_INDEX.items()
+}
+
+
 def get_embedded_ratio(location: str, gender: str) -> float:
     """Calculate embedded formal/informal wage ratio from PLFS baseline wages."""
-    wage_key = f"{location}_{gender}"
-    try:
-        salaried = BASELINE_WAGES[wage_key]['secondary_10yr'].value
-        casual = BASELINE_WAGES[wage_key]['casual_informal'].value
-        return salaried / casual
-    except:
-        return 1.86
+    return _EMBEDDED_RATIO.get((location, gender), 1.86)
 
 EMBEDDED_RATIO_AVERAGE = 1.86
 
@@ -1292,6 +1382,50 @@ WORKING_LIFE_INFORMAL = Parameter(
     """
 )
 
+# Every module-level scalar Parameter above, by name (BASELINE_WAGES is
+# measured data held fixed and kept out); see sample_all_parameters()
+ALL_PARAMETERS: Dict[str, Parameter] = {
+    name: obj for name, obj in globals().items() if isinstance(obj, Parameter)
+}
+
+# Struct-of-arrays view of the scalar-valued ALL_PARAMETERS (column j is
+# _PARAM_NAMES[j]) so sample_parameter_matrix() draws each distribution
+# family in one vectorized call. Distribution arguments by method:
+# triangular (low, mode, high), uniform (low, high), normal (mean=low,
+# sd=high), beta (shape_a, shape_b scaled to low..high = sensitivity_range).
+_METHOD_CODES = {'triangular': 0, 'uniform': 1, 'beta': 2, 'fixed': 3, 'normal': 4}
+
+
+def _sampling_row(param: Parameter) -> Tuple[float, float, float, float, float]:
+    """(low, mode, high, shape_a, shape_b) table row for one scalar parameter."""
+    method = param.sampling_method
+    if method == 'triangular':
+        low, mode, high = param.sampling_params
+        return low, mode, high, np.nan, np.nan
+    if method in ('uniform', 'normal'):
+        low, high = param.sampling_params
+        return low, np.nan, high, np.nan, np.nan
+    if method == 'beta':
+        low, high = param.sensitivity_range
+        return low, np.nan, high, *param.sampling_params
+    return (np.nan,) * 5
+
+
+_PARAM_NAMES: Tuple[str, ...] = tuple(
+    name for name, param in ALL_PARAMETERS.items() if np.ndim(param.value) == 0
+)
+_PARAM_VALUES = np.array([ALL_PARAMETERS[name].value for name in _PARAM_NAMES], dtype=float)
+_PARAM_METHOD = np.array(
+    [_METHOD_CODES[ALL_PARAMETERS[name].sampling_method] for name in _PARAM_NAMES],
+    dtype=np.int8
+)
+_PARAM_LOW, _PARAM_MODE, _PARAM_HIGH, _PARAM_SHAPE_A, _PARAM_SHAPE_B = np.array(
+    [_sampling_row(ALL_PARAMETERS[name]) for name in _PARAM_NAMES], dtype=float
+).T.copy()
+for _table in (_PARAM_VALUES, _PARAM_METHOD, _PARAM_LOW, _PARAM_MODE,
+               _PARAM_HIGH, _PARAM_SHAPE_A, _PARAM_SHAPE_B):
+    _table.flags.writeable = False
+
 # =============================================================================
 # SECTION 8: PARAMETER DEPENDENCIES AND RELATIONSHIPS
 # =============================================================================
@@ -1375,18 +1509,24 @@ def get_formal_entry_probability(education_level: str, state: str = 'national')
 # SECTION 9: MONTE CARLO SAMPLING FUNCTIONS
 # =============================================================================
 
-def sample_parameter(param: Parameter, n_samples: int = 1000, seed: int = None) -> np.ndarray:
+def sample_parameter(param: Parameter, n_samples: int = 1000, seed: int = None,
+                     rng: Optional[np.random.Generator] = None) -> np.ndarray:
     """
     Generate Monte Carlo samples from parameter's uncertainty distribution.
     
     Args:
         param: Parameter object with sampling_method and sampling_params
         n_samples: Number of Monte Carlo draws
-        seed: Random seed for reproducibility
+        seed: Random seed for reproducibility (global NumPy random state)
+        rng: Optional numpy Generator; when given, draws come from it via
+             Parameter.sample and seed is ignored
     
     Returns:
         np.ndarray: Array of sampled values
     """
+    if rng is not None:
+        return param.sample(n_samples, rng)
+
     if seed is not None:
         np.random.seed(seed)
     
@@ -1416,9 +1556,63 @@ def sample_parameter(param: Parameter, n_samples: int = 1000, seed: int = None)
         raise ValueError(f"Unknown sampling method: {param.sampling_method}")
 
 
+def sample_parameter_matrix(n_samples: int = 1000,
+                            rng: Optional[np.random.Generator] = None) -> np.ndarray:
+    """
+    Draw n_samples of every scalar parameter as one (n_samples, P) matrix.
+
+    Column j holds _PARAM_NAMES[j]. Parameters are grouped by sampling
+    method (_PARAM_METHOD) and each group is drawn with a single Generator
+    call over the struct-of-arrays tables, rather than one call per
+    Parameter object.
+    """
+    rng = rng if rng is not None else np.random.default_rng()
+    out = np.empty((n_samples, len(_PARAM_NAMES)))
+    low, mode, high = _PARAM_LOW, _PARAM_MODE, _PARAM_HIGH
+
+    for code in np.unique(_PARAM_METHOD):
+        mask = _PARAM_METHOD == code
+        size = (n_samples, int(mask.sum()))
+        if code == _METHOD_CODES['triangular']:
+            out[:, mask] = rng.triangular(low[mask], mode[mask], high[mask], size)
+        elif code == _METHOD_CODES['uniform']:
+            out[:, mask] = rng.uniform(low[mask], high[mask], size)
+        elif code == _METHOD_CODES['normal']:
+            out[:, mask] = rng.normal(low[mask], high[mask], size)
+        elif code == _METHOD_CODES['beta']:
+            draws = rng.beta(_PARAM_SHAPE_A[mask], _PARAM_SHAPE_B[mask], size)
+            out[:, mask] = low[mask] + draws * (high[mask] - low[mask])
+        else:  # fixed
+            out[:, mask] = _PARAM_VALUES[mask]
+
+    return out
+
+
+def sample_all_parameters(n_samples: int = 1000, seed: int = None) -> Dict[str, np.ndarray]:
+    """
+    Draw n_samples for every parameter in ALL_PARAMETERS in one pass.
+
+    Scalar parameters come from sample_parameter_matrix() and tuple-valued
+    ones from Parameter.sample, all from a single default_rng(seed), so
+    results are reproducible for a given seed.
+
+    Returns:
+        Dict mapping parameter names to (n_samples,) arrays; tuple-valued
+        fixed parameters (COUNTERFACTUAL_SCHOOLING) give (n_samples, k).
+    """
+    rng = np.random.default_rng(seed)
+    matrix = sample_parameter_matrix(n_samples, rng)
+    samples = {name: matrix[:, j] for j, name in enumerate(_PARAM_NAMES)}
+    for name, param in ALL_PARAMETERS.items():
+        if name not in samples:
+            samples[name] = param.sample(n_samples, rng)
+    return {name: samples[name] for name in ALL_PARAMETERS}
+
+
 def run_monte_carlo_sensitivity(
     n_simulations: int = 1000,
-    tier1_only: bool = False
+    tier1_only: bool = False,
+    rng: Optional[np.random.Generator] = None
 ) -> Dict[str, np.ndarray]:
     """
     Run Monte Carlo simulation varying parameters according to their uncertainty distributions.
@@ -1426,6 +1620,8 @@ def run_monte_carlo_sensitivity(
     Args:
         n_simulations: Number of simulation runs
         tier1_only: If True, only vary Tier 1 (critical) parameters; hold others fixed
+        rng: Optional numpy Generator; when given, draws use Parameter.sample
+             instead of the global NumPy random state
     
     Returns:
         Dict mapping parameter names to arrays of sampled values
@@ -1453,7 +1649,10 @@ def run_monte_carlo_sensitivity(
             sampled_params[name] = np.full(n_simulations, param.value)
         else:
             # Sample from uncertainty distribution
-            sampled_params[name] = sample_parameter(param, n_simulations)
+            if rng is not None:
+                sampled_params[name] = param.sample(n_simulations, rng)
+            else:
+                sampled_params[name] = sample_parameter(param, n_simulations)
     
     return sampled_params
 
@@ -1507,7 +1706,8 @@ SCENARIO_CONFIGS = {
 }
 
 
-def get_scenario_parameters(scenario: str = 'moderate') -> Dict[str, float]:
+@lru_cache(maxsize=8)
+def get_scenario_parameters(scenario: str = 'moderate') -> Mapping[str, float]:
     """
     Get parameter value overrides for specified scenario.
     
@@ -1515,7 +1715,9 @@ def get_scenario_parameters(scenario: str = 'moderate') -> Dict[str, float]:
         scenario: One of 'conservative', 'moderate', 'optimistic'
     
     Returns:
-        Dict mapping parameter names to scenario-specific values
+        Read-only mapping of parameter names to scenario-specific values.
+        Cached per scenario, so repeated calls return the same object;
+        use dict(...) for a mutable copy.
         
     Usage:
         scenario_params = get_scenario_parameters('conservative')
@@ -1536,7 +1738,7 @@ def get_scenario_parameters(scenario: str = 'moderate') -> Dict[str, float]:
     if scenario not in SCENARIO_CONFIGS:
         raise ValueError(f"Unknown scenario: {scenario}. Must be one of: {list(SCENARIO_CONFIGS.keys())}")
     
-    return SCENARIO_CONFIGS[scenario].copy()
+    return MappingProxyType(dict(SCENARIO_CONFIGS[scenario]))
 
 
 def apply_scenario_to_registry(registry: 'ParameterRegistry', scenario: str) -> None:
@@ -64,6 +64,24 @@ APPRENTICESHIP_ONLY_PARAMS = {
     'P_FORMAL_NO_TRAINING',
 }
 
+# Parameters LifetimeNPVCalculator.calculate_lnpv_batch() can vary row by
+# row: the tornado evaluates all their min/max settings as one (2k, T)
+# batch of wage streams instead of 2k scalar NPV calculations
+BATCHED_PARAMS = {
+    'P_FORMAL_RTE',
+    'RTE_TEST_SCORE_GAIN',
+    'TEST_SCORE_TO_YEARS',
+    'P_FORMAL_APPRENTICE',
+    'APPRENTICE_INITIAL_PREMIUM',
+    'APPRENTICE_DECAY_HALFLIFE',
+    'APPRENTICE_STIPEND_MONTHLY',
+    'P_FORMAL_NO_TRAINING',
+    'MINCER_RETURN_HS',
+    'REAL_WAGE_GROWTH_FORMAL',
+    'REAL_WAGE_GROWTH_INFORMAL',
+    'SOCIAL_DISCOUNT_RATE',
+}
+
 BOTH_INTERVENTIONS_PARAMS = {
     'MINCER_RETURN_HS',
     'EXPERIENCE_LINEAR',
@@ -157,34 +175,54 @@ def run_tornado_analysis(
     baseline_npv = base_result['lnpv']
     
     print(f"\n{'='*60}")
-    print(f"Tornado Analysis: {intervention.value.upper()}")
-    print(f"Reference: {gender.value} {location.value} {region.value}")
+    print(f"Tornado Analysis: {intervention.label.upper()}")
+    print(f"Reference: {gender.label} {location.label} {region.label}")
     print(f"Baseline NPV: Rs {baseline_npv:,.0f}")
     print(f"{'='*60}\n")
     
-    # Get active parameters
-    active_params = get_active_parameters(base_registry)
+    # Get active parameters (skipping those that don't affect this intervention)
+    active_params = [
+        (param_name, base_param)
+        for param_name, base_param in get_active_parameters(base_registry)
+        if affects_intervention(param_name, intervention)
+    ]
+    
+    # Batched parameters: row 2i holds parameter i at its min, row 2i+1 at
+    # its max, every other column at baseline
+    batched = [(name, p) for name, p in active_params if name in BATCHED_PARAMS]
+    npv_bounds = {}
+    if batched:
+        params_batch = {}
+        for i, (param_name, base_param) in enumerate(batched):
+            column = np.full(2 * len(batched), base_param.value, dtype=float)
+            column[2 * i:2 * i + 2] = (base_param.min_val, base_param.max_val)
+            params_batch[param_name] = column
+        batch_results = base_calc.calculate_lnpv_batch(
+            params_batch, intervention, gender, location, region
+        )
+        for i, (param_name, _) in enumerate(batched):
+            npv_bounds[param_name] = (batch_results[2 * i]['lnpv'],
+                                      batch_results[2 * i + 1]['lnpv'])
     
     for param_name, base_param in active_params:
-        # Skip if parameter doesn't affect this intervention
-        if not affects_intervention(param_name, intervention):
-            continue
-        
-        # Test at min value
-        registry_min = ParameterRegistry()
-        param_min = getattr(registry_min, param_name)
-        param_min.value = base_param.min_val
-        calc_min = LifetimeNPVCalculator(params=registry_min)
-        result_min = calc_min.calculate_lnpv(intervention, gender, location, region)
-        npv_at_min = result_min['lnpv']
-        
-        # Test at max value  
-        registry_max = ParameterRegistry()
-        param_max = getattr(registry_max, param_name)
-        param_max.value = base_param.max_val
-        calc_max = LifetimeNPVCalculator(params=registry_max)
-        result_max = calc_max.calculate_lnpv(intervention, gender, location, region)
-        npv_at_max = result_max['lnpv']
+        if param_name in npv_bounds:
+            npv_at_min, npv_at_max = npv_bounds[param_name]
+        else:
+            # Test at min value
+            registry_min = ParameterRegistry()
+            param_min = getattr(registry_min, param_name)
+            param_min.value = base_param.min_val
+            calc_min = LifetimeNPVCalculator(params=registry_min)
+            result_min = calc_min.calculate_lnpv(intervention, gender, location, region)
+            npv_at_min = result_min['lnpv']
+            
+            # Test at max value  
+            registry_max = ParameterRegistry()
+            param_max = getattr(registry_max, param_name)
+            param_max.value = base_param.max_val
+            calc_max = LifetimeNPVCalculator(params=registry_max)
+            result_max = calc_max.calculate_lnpv(intervention, gender, location, region)
+            npv_at_max = result_max['lnpv']
         
         # Calculate metrics
         delta_npv = abs(npv_at_max - npv_at_min)
@@ -213,7 +251,7 @@ def run_tornado_analysis(
             'npv_elasticity': npv_elasticity,
             'direction': direction,
             'affects_intervention': True,
-            'intervention': intervention.value,
+            'intervention': intervention.label,
         })
 
         elasticity_str = f"{npv_elasticity:.2f}" if npv_elasticity is not None else "N/A"
@@ -261,7 +299,7 @@ def run_breakeven_analysis(
     top_params = tornado_df.head(top_n)
     
     print(f"\n{'='*60}")
-    print(f"Break-even Analysis: {intervention.value.upper()} (Top {top_n})")
+    print(f"Break-even Analysis: {intervention.label.upper()} (Top {top_n})")
     print(f"{'='*60}\n")
     
     for _, row in top_params.iterrows():
@@ -310,7 +348,7 @@ def run_breakeven_analysis(
         
         results.append({
             'parameter_name': param_name,
-            'intervention': intervention.value,
+            'intervention': intervention.label,
             'baseline_value': baseline,
             'npv_zero_threshold': npv_zero_threshold,
             'margin_pct': margin_pct,
@@ -0,0 +1,7 @@
+"""Shared pytest setup: make the model modules in src/ importable."""
+
+import os
+import sys
+
+# Add src to path (as the scripts/ entry points do)
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
@@ -0,0 +1,59 @@
+"""
+Regression test for LifetimeNPVCalculator.update_params().
+
+A calculator refreshed via update_params() must give the same LNPV as a
+freshly built LifetimeNPVCalculator(params=registry), whether the registry
+was switched or edited in place.
+"""
+
+import math
+
+import pytest
+
+from economic_core_v4 import (
+    Gender, Intervention, LifetimeNPVCalculator, Location, ParameterRegistry, Region
+)
+
+DEMOGRAPHICS = [
+    (Gender.FEMALE, Location.RURAL, Region.SOUTH),
+    (Gender.MALE, Location.URBAN, Region.NORTH),
+]
+PARAMETER_NAMES = list(ParameterRegistry()._param_map)
+
+
+def _moved_value(name):
+    """Registry max for `name` (its min if the max equals the point value)."""
+    param = getattr(ParameterRegistry(), name)
+    return param.max_val if param.max_val != param.value else param.min_val
+
+
+def _lnpvs(calculator):
+    return [
+        calculator.calculate_lnpv(intervention, *demographic)['lnpv']
+        for intervention in Intervention
+        for demographic in DEMOGRAPHICS
+    ]
+
+
+@pytest.mark.parametrize("name", PARAMETER_NAMES)
+def test_update_params_matches_fresh_calculator(name):
+    registry = ParameterRegistry()
+    getattr(registry, name).value = _moved_value(name)
+    expected = _lnpvs(LifetimeNPVCalculator(params=registry))
+
+    # Switch to another registry
+    switched = LifetimeNPVCalculator(params=ParameterRegistry())
+    _lnpvs(switched)  # warm the caches on the old registry
+    switched.update_params(registry)
+
+    # Edit the calculator's own registry in place
+    edited = LifetimeNPVCalculator(params=ParameterRegistry())
+    _lnpvs(edited)
+    getattr(edited.params, name).value = _moved_value(name)
+    edited.update_params()
+
+    for calculator in (switched, edited):
+        assert all(
+            math.isclose(actual, want, rel_tol=1e-9)
+            for actual, want in zip(_lnpvs(calculator), expected)
+        )